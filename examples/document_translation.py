@@ -8,6 +8,7 @@ This example demonstrates:
 - Basic document translation
 - Advanced options with memories and glossaries
 - Step-by-step document translation with status monitoring
+- Translating a whole directory of documents concurrently
 """
 
 def main():
@@ -24,6 +25,7 @@ def main():
 
     # Replace with your actual document file path
     sample_file_path = "sample_document.docx"  # Create this file with your content
+    sample_filename = os.path.basename(sample_file_path)
     
     if not os.path.exists(sample_file_path):
         print(f"Please create a sample document file at: {sample_file_path}")
@@ -35,12 +37,12 @@ def main():
     source_lang = "en-US"
     target_lang = "de-DE"
     
-    print(f"Translating document: {os.path.basename(sample_file_path)} from {source_lang} to {target_lang}")
+    print(f"Translating document: {sample_filename} from {source_lang} to {target_lang}")
     
     try:
         translated_content = lara.documents.translate(
             file_path=sample_file_path,
-            filename=os.path.basename(sample_file_path),
+            filename=sample_filename,
             source=source_lang,
             target=target_lang
         )
@@ -51,7 +53,7 @@ def main():
             f.write(translated_content)
         
         print("✅ Document translation completed")
-        print(f"📄 Translated file saved to: {os.path.basename(output_path)}\n")
+        print(f"📄 Translated file saved to: {output_path}\n")
     except Exception as e:
         print(f"Error translating document: {e}\n")
         return
@@ -61,7 +63,7 @@ def main():
     try:
         translated_content2 = lara.documents.translate(
             file_path=sample_file_path,
-            filename=os.path.basename(sample_file_path),
+            filename=sample_filename,
             source=source_lang,
             target=target_lang,
             adapt_to=["mem_1A2b3C4d5E6f7G8h9I0jKl"],  # Replace with actual memory IDs
@@ -74,7 +76,7 @@ def main():
             f.write(translated_content2)
         
         print("✅ Advanced document translation completed")
-        print(f"📄 Translated file saved to: {os.path.basename(output_path2)}")
+        print(f"📄 Translated file saved to: {output_path2}")
     except Exception as e:
         print(f"Error in advanced translation: {e}")
     print()
@@ -87,7 +89,7 @@ def main():
         print("Step 1: Uploading document...")
         document = lara.documents.upload(
             file_path=sample_file_path,
-            filename=os.path.basename(sample_file_path),
+            filename=sample_filename,
             source=source_lang,
             target=target_lang,
             adapt_to=["mem_1A2b3C4d5E6f7G8h9I0jKl"],  # Replace with actual memory IDs
@@ -105,7 +107,8 @@ def main():
         print("\nStep 3: Downloading would happen after translation completes...")
 
         try:
-            downloaded_content = lara.documents.download(document.id)
+            # The translated document is streamed straight to the output file, without buffering it in memory
+            lara.documents.download(document.id, dest="step_by_step_document_translated.docx")
         except Exception as download_error:
             print(f"Download demonstration: {download_error}")
         
@@ -113,5 +116,23 @@ def main():
     except Exception as e:
         print(f"Error in step-by-step process: {e}")
 
+    # Example 4: Translate all the documents of a directory concurrently
+    print("\n=== Directory Translation ===")
+    input_dir = "documents"  # Replace with a directory containing your documents
+    output_dir = "documents_translated"
+
+    if not os.path.isdir(input_dir):
+        print(f"Please create a directory with some documents to translate at: {input_dir}")
+        return
+
+    try:
+        file_paths = [os.path.join(input_dir, name) for name in sorted(os.listdir(input_dir))]
+        os.makedirs(output_dir, exist_ok=True)
+
+        lara.documents.translate_many(file_paths, source=source_lang, target=target_lang, dest_dir=output_dir)
+        print(f"✅ {len(file_paths)} documents translated to: {output_dir}")
+    except Exception as e:
+        print(f"Error translating directory: {e}")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -93,13 +93,10 @@ def main():
         try:
             # Export as CSV table unidirectional format
             print("📤 Exporting as CSV table unidirectional...")
-            csv_uni_data = lara.glossaries.export(glossary_id, content_type="csv/table-uni", source="en-US")
-            print(f"✅ CSV unidirectional export successful ({len(csv_uni_data)} bytes)")
-
-            # Save sample export to file - replace with your desired output path
+            # The export is streamed straight to the file - replace with your desired output path
             export_file_path = "exported_glossary.csv"  # Replace with actual path
-            with open(export_file_path, 'wb') as f:
-                f.write(csv_uni_data)
+            lara.glossaries.export(glossary_id, content_type="csv/table-uni", source="en-US", dest=export_file_path)
+            print(f"✅ CSV unidirectional export successful ({os.path.getsize(export_file_path)} bytes)")
             print(f"💾 Sample export saved to: {os.path.basename(export_file_path)}")
             print()
         except Exception as e:
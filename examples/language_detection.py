@@ -1,4 +1,4 @@
-from lara_sdk import AccessKey, Translator
+from lara_sdk import AccessKey, Translator, DetectRequest
 import os
 
 """
@@ -9,6 +9,7 @@ This example demonstrates:
 - Detecting language of multiple strings
 - Using hint parameter to improve detection
 - Using passlist to restrict detected languages
+- Detecting many independent inputs concurrently
 """
 
 def main():
@@ -74,6 +75,19 @@ def main():
         print(f"Detected language: {result5.language}")
         print(f"Content type: {result5.content_type}\n")
 
+        # Example 6: Detect many independent inputs at once, each with its own options
+        print("=== Batch Detection ===")
+        requests = [
+            DetectRequest("Bonjour, comment allez-vous?"),
+            DetectRequest("Hello", hint="en"),
+            DetectRequest("Guten Tag", passlist=["de-DE", "en-US", "fr-FR"]),
+            DetectRequest("Buongiorno", hint="it", passlist=["it-IT", "es-ES", "pt-PT"])
+        ]
+        results = lara.detect_batch(requests)
+        for i, result in enumerate(results):
+            print(f"{i + 1}. Text: {requests[i].text} -> Detected language: {result.language}")
+        print()
+
     except Exception as error:
         print(f"Error: {error}")
 
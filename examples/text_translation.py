@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from lara_sdk import AccessKey, Translator, TextBlock
 import os
 
@@ -12,6 +14,8 @@ This example demonstrates:
 - Auto-detect source language
 - Advanced options
 - Get available languages
+- Quality estimation
+- Running independent requests concurrently
 """
 
 def main():
@@ -25,22 +29,26 @@ def main():
     credentials = AccessKey(access_key_id, access_key_secret)
     lara = Translator(credentials)
 
-    try:
-        # Example 1: Basic single string translation
-        print("=== Basic Single String Translation ===")
-        result1 = lara.translate("Hello, world!", target="fr-FR", source="en-US")
-        print("Original: Hello, world!")
-        print(f"French: {result1.translation}\n")
+    # The examples below are independent of each other: each one is a function returning its output,
+    # and all of them are run concurrently over the same Translator (and its pooled HTTP connections).
+
+    # Example 1: Basic single string translation
+    def basic_translation():
+        result = lara.translate("Hello, world!", target="fr-FR", source="en-US")
+        return ("=== Basic Single String Translation ===\n"
+                "Original: Hello, world!\n"
+                f"French: {result.translation}\n")
 
-        # Example 2: Multiple strings translation
-        print("=== Multiple Strings Translation ===")
+    # Example 2: Multiple strings translation
+    def multiple_strings_translation():
         texts = ["Hello", "How are you?", "Goodbye"]
-        result2 = lara.translate(texts, target="es-ES", source="en-US")
-        print(f"Original: {texts}")
-        print(f"Spanish: {result2.translation}\n")
+        result = lara.translate(texts, target="es-ES", source="en-US")
+        return ("=== Multiple Strings Translation ===\n"
+                f"Original: {texts}\n"
+                f"Spanish: {result.translation}\n")
 
-        # Example 3: TextBlocks translation (mixed translatable/non-translatable content)
-        print("=== TextBlocks Translation ===")
+    # Example 3: TextBlocks translation (mixed translatable/non-translatable content)
+    def text_blocks_translation():
         text_blocks = [
             TextBlock(text="Adventure novels, mysteries, cookbooks—wait, who packed those?", translatable=True),
             TextBlock(text="<br>", translatable=False),  # Non-translatable HTML
@@ -49,35 +57,37 @@ def main():
             TextBlock(text="Every page you turn is a new journey, and the best part?", translatable=True)
         ]
 
-        result3 = lara.translate(text_blocks, target="it-IT", source="en-US")
-        print(f"Original TextBlocks: {len(text_blocks)} blocks")
-        print(f"Translated blocks: {len(result3.translation)}")
-        for i, translation in enumerate(result3.translation):
-            print(f"Block {i + 1}: {translation.text}")
-        print()
-
-        # Example 4: Translation with instructions
-        print("=== Translation with Instructions ===")
-        result4 = lara.translate(
+        result = lara.translate(text_blocks, target="it-IT", source="en-US")
+        output = ("=== TextBlocks Translation ===\n"
+                  f"Original TextBlocks: {len(text_blocks)} blocks\n"
+                  f"Translated blocks: {len(result.translation)}\n")
+        for i, translation in enumerate(result.translation):
+            output += f"Block {i + 1}: {translation.text}\n"
+        return output
+
+    # Example 4: Translation with instructions
+    def translation_with_instructions():
+        result = lara.translate(
             "Could you send me the report by tomorrow morning?",
             target="de-DE",
             source="en-US",
             instructions=["Be formal", "Use technical terminology"]
         )
-        print("Original: Could you send me the report by tomorrow morning?")
-        print(f"German (formal): {result4.translation}\n")
-
-        # Example 5: Auto-detecting source language
-        print("=== Auto-detect Source Language ===")
-        result5 = lara.translate("Bonjour le monde!", target="en-US")
-        print("Original: Bonjour le monde!")
-        print(f"Detected source: {result5.source_language}")
-        print(f"English: {result5.translation}\n")
-
-        # Example 6: Advanced options with comprehensive settings
-        print("=== Translation with Advanced Options ===")
-
-        result6 = lara.translate(
+        return ("=== Translation with Instructions ===\n"
+                "Original: Could you send me the report by tomorrow morning?\n"
+                f"German (formal): {result.translation}\n")
+
+    # Example 5: Auto-detecting source language
+    def auto_detect_source_language():
+        result = lara.translate("Bonjour le monde!", target="en-US")
+        return ("=== Auto-detect Source Language ===\n"
+                "Original: Bonjour le monde!\n"
+                f"Detected source: {result.source_language}\n"
+                f"English: {result.translation}\n")
+
+    # Example 6: Advanced options with comprehensive settings
+    def translation_with_advanced_options():
+        result = lara.translate(
             "This is a comprehensive translation example",
             target="it-IT",
             source="en-US",
@@ -88,11 +98,12 @@ def main():
             content_type="text/plain",
             timeout_ms=10000,
         )
-        print("Original: This is a comprehensive translation example")
-        print(f"Italian (with all options): {result6.translation}\n")
+        return ("=== Translation with Advanced Options ===\n"
+                "Original: This is a comprehensive translation example\n"
+                f"Italian (with all options): {result.translation}\n")
 
-        # Example 7: Profanities detection and handling options
-        print("=== Translation with Profanities Detection and Handling Options ===")
+    # Example 7: Profanities detection and handling options
+    def translation_with_profanities_options():
         profanity_text = "Don't be such a tool."
         detect_result = lara.translate(profanity_text, target="it-IT", source="en-US",
                                        profanities_detect="source_target",
@@ -100,35 +111,50 @@ def main():
         hide_result = lara.translate(profanity_text, target="it-IT", source="en-US",
                                      profanities_detect="target",
                                      profanities_handling="hide", verbose=True)
-        print(f"Original: {profanity_text}")
-        print(f"Detect mode translation: {detect_result.translation}")
-        print(f"Hide mode translation: {hide_result.translation}")
+        return ("=== Translation with Profanities Detection and Handling Options ===\n"
+                f"Original: {profanity_text}\n"
+                f"Detect mode translation: {detect_result.translation}\n"
+                f"Hide mode translation: {hide_result.translation}\n")
 
-        # Example 8: Get available languages
-        print("=== Available Languages ===")
+    # Example 8: Get available languages
+    def available_languages():
         languages = lara.languages()
-        print(f"Supported languages: {languages}")
+        return ("=== Available Languages ===\n"
+                f"Supported languages: {languages}\n")
 
-        # Example 9: Quality estimation for a single sentence pair
-        print("\n=== Quality Estimation: single sentence ===")
+    # Example 9: Quality estimation for a single sentence pair
+    def quality_estimation_single():
         qe_single = lara.quality_estimation(
             source="en-US", target="it-IT",
             sentence="Hello, how are you today?",
             translation="Ciao, come stai oggi?",
         )
-        print(f"Score: {qe_single.score}")
+        return ("=== Quality Estimation: single sentence ===\n"
+                f"Score: {qe_single.score}\n")
 
-        # Example 10: Quality estimation for a batch of sentence pairs
-        print("\n=== Quality Estimation: batch ===")
+    # Example 10: Quality estimation for a batch of sentence pairs
+    def quality_estimation_batch():
         qe_batch = lara.quality_estimation(
             source="en-US", target="it-IT",
             sentence=["Good morning.", "The weather is nice."],
             translation=["Buongiorno.", "Il tempo è bello."],
         )
-        print(f"Scores: {[r.score for r in qe_batch]}")
-
-    except Exception as error:
-        print(f"Error: {error}")
+        return ("=== Quality Estimation: batch ===\n"
+                f"Scores: {[r.score for r in qe_batch]}\n")
+
+    examples = [
+        basic_translation, multiple_strings_translation, text_blocks_translation, translation_with_instructions,
+        auto_detect_source_language, translation_with_advanced_options, translation_with_profanities_options,
+        available_languages, quality_estimation_single, quality_estimation_batch
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = [executor.submit(example) for example in examples]
+        for future in as_completed(futures):
+            try:
+                print(future.result())
+            except Exception as error:
+                print(f"Error: {error}\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
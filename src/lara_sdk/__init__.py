@@ -1,7 +1,43 @@
-from ._client import LaraObject
+import importlib
+from typing import TYPE_CHECKING
+
 from ._credentials import Credentials, AccessKey, AuthToken
 from ._errors import LaraApiError, LaraError
-from ._translator import Memory, MemoryImport, MemoryExport, TextBlock, TextResult, DetectPrediction, DetectResult, Memories, Translator, TranslatePriority, UseCache, Documents, Document, DocumentStatus, DocxExtractionParams, DocumentExtractionParams, GlossaryTerm, Audio, AudioStatus, AudioTranslator, AudioOptions, VoiceGender, ImageParagraph, ImageTranslator, ProfanityDetectResult, ProfanitiesResult, Styleguide, StyleguideChange, StyleguideResults, Styleguides, QualityEstimationResult
+
+if TYPE_CHECKING:
+    from ._client import LaraObject
+    from ._translator import Memory, MemoryImport, MemoryExport, MemoryTranslation, TextBlock, TextResult, DetectPrediction, DetectResult, DetectRequest, Memories, Translator, TranslateRequest, TranslatePriority, UseCache, Documents, Document, DocumentStatus, DocxExtractionParams, DocumentExtractionParams, GlossaryTerm, Audio, AudioStatus, AudioTranslator, AudioOptions, VoiceGender, ImageParagraph, ImageTranslator, ProfanityDetectResult, ProfanitiesResult, Styleguide, StyleguideChange, StyleguideResults, Styleguides, QualityEstimationResult
+
+# The client and the translator modules pull in requests (and with it ssl and http), so they are
+# only imported the first time one of their names is accessed.
+_LAZY_IMPORTS = {
+    'LaraObject': '._client',
+    **{name: '._translator' for name in (
+        'Memory', 'MemoryImport', 'MemoryExport', 'MemoryTranslation', 'TextBlock', 'TextResult', 'DetectPrediction',
+        'DetectResult', 'DetectRequest', 'Memories', 'Translator', 'TranslateRequest', 'TranslatePriority', 'UseCache',
+        'Documents', 'Document', 'DocumentStatus', 'DocxExtractionParams', 'DocumentExtractionParams', 'GlossaryTerm',
+        'Audio', 'AudioStatus', 'AudioTranslator', 'AudioOptions', 'VoiceGender', 'ImageParagraph', 'ImageTranslator',
+        'ProfanityDetectResult', 'ProfanitiesResult', 'Styleguide', 'StyleguideChange', 'StyleguideResults',
+        'Styleguides', 'QualityEstimationResult'
+    )}
+}
+
+__all__ = ['Credentials', 'AccessKey', 'AuthToken', 'LaraApiError', 'LaraError', *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # This constant is auto-generated by the build script.
 # Manual modifications will be overwritten and may cause unexpected behavior.
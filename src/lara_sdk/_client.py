@@ -1,50 +1,150 @@
 import base64
 import datetime
+import functools
 import hashlib
 import hmac
 import json
+import sys
+import threading
 import time
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Union, List, Iterator, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import __version__
 from ._credentials import AccessKey, AuthToken
 from ._errors import LaraApiError
+from ._s3client import DownloadDestination, write_response_content
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        # Metadata dicts may have non-str keys, which json.dumps converts to strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('UTF-8')
+
+    _json_loads = json.loads
+
+
+if sys.version_info >= (3, 9):
+    def _md5(data: bytes):
+        # Content-MD5 is an integrity checksum, not a security primitive: this keeps it usable on FIPS builds
+        return hashlib.md5(data, usedforsecurity=False)
+else:
+    _md5 = hashlib.md5
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def _http_date() -> str:
+    """
+    Returns the current time as an RFC 1123 date (e.g. "Tue, 01 Jul 2025 12:00:00 GMT"). Unlike strftime,
+    the day and month names never depend on the current locale.
+    """
+    t = time.gmtime()
+    return (f'{_WEEKDAYS[t.tm_wday]}, {t.tm_mday:02d} {_MONTHS[t.tm_mon - 1]} {t.tm_year:04d} '
+            f'{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d} GMT')
+
+
+def _without_nones(body: Dict) -> Dict:
+    """
+    Returns body without its None values: only the options actually set are sent. The dict is only copied if it
+    actually contains any.
+    """
+    if any(v is None for v in body.values()):
+        return {k: v for k, v in body.items() if v is not None}
+    return body
+
+
+if sys.version_info >= (3, 11):
+    # Python 3.11 parses any ISO 8601 string, including the "Z" suffix
+    _parse_iso_date = datetime.datetime.fromisoformat
+else:
+    def _parse_iso_date(date: str) -> datetime.datetime:
+        if date.endswith("Z"):
+            date = date[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(date)
+
+# Records of the same response often share timestamps, and datetime objects are immutable
+_parse_iso_date = functools.lru_cache(maxsize=2048)(_parse_iso_date)
 
 
 class LaraObject:
     """
     This serves as a base class for all Lara API returned objects.
     """
+    __slots__ = ()
 
     @staticmethod
     def _parse_date(date: Optional[str]) -> Optional[datetime.datetime]:
         if date is None:
             return None
-        if date.endswith("Z"):
-            date = date[:-1] + "+00:00"
-        return datetime.datetime.fromisoformat(date) if date is not None else None
+        return _parse_iso_date(date)
 
     def __repr__(self):
         return self.__str__()
 
+    def _fields(self) -> Iterator[Tuple[str, object]]:
+        # Subclasses may store their attributes in __slots__, in __dict__ or both
+        for cls in reversed(type(self).__mro__):
+            slots = cls.__dict__.get('__slots__', ())
+            for name in ((slots,) if isinstance(slots, str) else slots):
+                if name == '__weakref__' or not hasattr(self, name):
+                    continue
+                # A private slot backing a lazy attribute is shown under the public name
+                if name.startswith('_') and isinstance(getattr(type(self), name[1:], None), LazyDate):
+                    name = name[1:]
+                yield name, getattr(self, name)
+        yield from getattr(self, '__dict__', {}).items()
+
     def __str__(self):
-        result = f"{self.__class__.__name__}("
-        for name, value in self.__dict__.items():
+        fields = []
+        for name, value in self._fields():
             if isinstance(value, datetime.datetime):
                 value = value.isoformat()
             if isinstance(value, str):
                 value = f'"{value}"'
-            result += f"{name}={value}, "
+            fields.append(f"{name}={value}")
+
+        return f"{self.__class__.__name__}({', '.join(fields)})"
+
+
+class LazyDate:
+    """
+    A LaraObject date attribute, set to the ISO 8601 string returned by the API and parsed into a datetime only
+    the first time it is read. The value is stored in a private slot named after the attribute ("_" + name).
+    """
 
-        return result[:-2] + ")"
+    def __set_name__(self, owner, name: str):
+        self._slot: str = '_' + name
 
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        value = getattr(obj, self._slot)
+        if isinstance(value, str):
+            value = LaraObject._parse_date(value)
+            setattr(obj, self._slot, value)
+        return value
+
+    def __set__(self, obj, value: Union[str, datetime.datetime, None]) -> None:
+        setattr(obj, self._slot, value)
 
 
 class LaraClient:
     """
     This class is used to interact with Lara via the REST API with JWT authentication support.
     """
+    _DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
 
     def __init__(self, auth: Union[AccessKey, AuthToken], server_url: str = None):
         """
@@ -55,7 +155,12 @@ class LaraClient:
         """
         self.base_url: str = (server_url or 'https://api.laratranslate.com').strip().rstrip('/')
         self.sdk_name: str = 'lara-python'
-        self.sdk_version: str = __import__('lara_sdk').__version__
+        self.sdk_version: str = __version__
+        # Headers sent unchanged with every API request
+        self._base_headers: Dict[str, str] = {
+            'X-Lara-SDK-Name': self.sdk_name,
+            'X-Lara-SDK-Version': self.sdk_version
+        }
 
         # Authentication state
         self._auth: Union[AccessKey, AuthToken] = auth
@@ -67,7 +172,22 @@ class LaraClient:
             self._token = auth.token
             self._refresh_token = auth.refresh_token
 
+        # The AccessKey secret is encoded once, rather than on every challenge signature
+        self._secret_bytes: Optional[bytes] = auth.secret.encode('UTF-8') if isinstance(auth, AccessKey) else None
+
+        # Serializes token (re)acquisition when the client is shared across threads
+        self._auth_lock: threading.Lock = threading.Lock()
+
+        # Keep-alive connection pool large enough for concurrent use of the same client. Failures to
+        # (re)open a pooled connection are retried, as the request has not reached the server yet; GET requests
+        # are also retried when a gateway reports the service as temporarily unavailable.
+        retries = Retry(total=3, connect=3, read=0, status=2, backoff_factor=.2,
+                        status_forcelist=(502, 503, 504), allowed_methods=frozenset({'GET', 'HEAD'}),
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
         self.session: requests.Session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def get(self, path: str, params: Dict = None, headers: Dict = None) -> Optional[Union[Dict, List, bytes]]:
         """
@@ -122,6 +242,22 @@ class LaraClient:
         """
         return self._request_stream('POST', path, body, files, headers)
 
+    def download(self, path: str, dest: DownloadDestination, params: Dict = None, headers: Dict = None) -> None:
+        """
+        Sends a GET request to the Lara API and streams the response body into dest.
+        :param path: The path to send the request to.
+        :param dest: A file path or a binary file-like object the response body is written to.
+        :param params: The parameters to send with the request.
+        :param headers: Additional headers to include in the request.
+        """
+        self._request_download(path, dest, params, headers)
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session, releasing its pooled connections.
+        """
+        self.session.close()
+
     def _is_token_expired(self, buffer_seconds: int = 5) -> bool:
         """Check if the current JWT token is expired or about to expire.
 
@@ -135,7 +271,7 @@ class LaraClient:
             if len(parts) != 3:
                 return True
             padded_encoded_payload = parts[1] + '=' * (-len(parts[1]) % 4)  # Pad base64 string if necessary
-            payload = json.loads(base64.urlsafe_b64decode(padded_encoded_payload))
+            payload = _json_loads(base64.urlsafe_b64decode(padded_encoded_payload))
             exp = payload.get('exp')
             if not isinstance(exp, (int, float)):
                 return True
@@ -143,39 +279,61 @@ class LaraClient:
         except Exception:
             return True
 
+    def _ensure_token(self) -> None:
+        """
+        Makes sure a valid, non-expired token is available, authenticating if needed.
+        """
+        if self._token is None or self._is_token_expired():
+            with self._auth_lock:
+                if self._token is None or self._is_token_expired():
+                    self._token = None
+                    self._authenticate()
+
+    def _renew_token(self) -> None:
+        """
+        Discards the current token (rejected by the server) and obtains a new one.
+        """
+        with self._auth_lock:
+            self._token = None
+            self._refresh_or_reauthenticate()
+
+    def _build_headers(self, headers: Optional[Dict] = None) -> Dict:
+        """
+        Returns the headers of an authenticated API request, including the given custom headers.
+        """
+        _headers = self._base_headers.copy()
+        _headers['Date'] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        _headers['Authorization'] = f'Bearer {self._token}'
+
+        if headers is not None:
+            _headers.update(headers)
+
+        return _headers
+
     def _request(self, method: str, path: str, body: Dict = None, files: Dict = None, headers: Dict = None,
                  retry_count: int = 0) -> Optional[Union[Dict, List, bytes]]:
         """
         Execute an authenticated HTTP request with automatic token management.
         """
-        # Ensure we have a valid, non-expired token
-        if self._token is None or self._is_token_expired():
-            self._token = None
-            self._authenticate()
+        self._ensure_token()
 
         if not path.startswith('/'):
             path = '/' + path
 
-        _headers = {
-            'Date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            'X-Lara-SDK-Name': self.sdk_name,
-            'X-Lara-SDK-Version': self.sdk_version,
-            'Authorization': f'Bearer {self._token}'
-        }
-
-        # Add custom headers
-        if headers is not None:
-            _headers.update(headers)
+        _headers = self._build_headers(headers)
 
         if body is not None:
-            body = {k: v for k, v in body.items() if v is not None}
+            body = _without_nones(body)
 
         if files is not None:
             response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, data=body, files=files)
         elif method == 'GET':
             response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, params=body)
+        elif body is not None:
+            _headers['Content-Type'] = 'application/json'
+            response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, data=_json_dumps(body))
         else:
-            response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, json=body)
+            response = self.session.request(method, f'{self.base_url}{path}', headers=_headers)
 
         # Handle successful responses
         if 200 <= response.status_code < 300:
@@ -184,63 +342,79 @@ class LaraClient:
             if "text/csv" in response.headers.get('Content-Type', '') or "image/" in response.headers.get('Content-Type', ''):
                 return response.content
             try:
-                return response.json()
+                return _json_loads(response.content)
             except:
                 return None
 
         # Handle 401 - token expired, refresh and retry once
         if response.status_code == 401 and retry_count < 1:
-            self._token = None
-            self._refresh_or_reauthenticate()
+            self._renew_token()
             return self._request(method, path, body, files, headers, retry_count=retry_count + 1)
 
         raise LaraApiError.from_response(response)
 
     def _request_stream(self, method: str, path: str, body: Dict = None, files: Dict = None, headers: Dict = None,
                         retry_count: int = 0):
-        # Ensure we have a valid, non-expired token
-        if self._token is None or self._is_token_expired():
-            self._token = None
-            self._authenticate()
+        self._ensure_token()
 
         if not path.startswith('/'):
             path = '/' + path
 
-        _headers = {
-            'Date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            'X-Lara-SDK-Name': self.sdk_name,
-            'X-Lara-SDK-Version': self.sdk_version,
-            'Authorization': f'Bearer {self._token}'
-        }
-
-        if headers is not None:
-            _headers.update(headers)
+        _headers = self._build_headers(headers)
 
         if body is not None:
-            body = {k: v for k, v in body.items() if v is not None}
+            body = _without_nones(body)
 
         if files is not None:
             response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, data=body, files=files, stream=True)
+        elif body is not None:
+            _headers['Content-Type'] = 'application/json'
+            response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, data=_json_dumps(body),
+                                            stream=True)
         else:
-            response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, json=body, stream=True)
+            response = self.session.request(method, f'{self.base_url}{path}', headers=_headers, stream=True)
 
         if not (200 <= response.status_code < 300):
             # Handle 401 - token expired, refresh and retry once
             if response.status_code == 401 and retry_count < 1:
-                self._token = None
-                self._refresh_or_reauthenticate()
+                self._renew_token()
                 yield from self._request_stream(method, path, body, files, headers, retry_count=retry_count + 1)
                 return
 
             raise LaraApiError.from_response(response)
 
-        for line in response.iter_lines(decode_unicode=True):
+        for line in response.iter_lines():
             if line:
                 try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
+                    yield _json_loads(line)
+                except ValueError:
                     pass
 
+    def _request_download(self, path: str, dest: DownloadDestination, params: Dict = None, headers: Dict = None,
+                          retry_count: int = 0) -> None:
+        self._ensure_token()
+
+        if not path.startswith('/'):
+            path = '/' + path
+
+        _headers = self._build_headers(headers)
+
+        if params is not None:
+            params = _without_nones(params)
+
+        with self.session.request('GET', f'{self.base_url}{path}', headers=_headers, params=params,
+                                  stream=True) as response:
+            if 200 <= response.status_code < 300:
+                write_response_content(response, dest, self._DOWNLOAD_CHUNK_SIZE)
+                return
+
+            if response.status_code != 401 or retry_count >= 1:
+                raise LaraApiError.from_response(response)
+
+        # Handle 401 - token expired, refresh and retry once
+        self._renew_token()
+        self._request_download(path, dest, params, headers, retry_count=retry_count + 1)
+
     def _authenticate(self) -> str:
         """
         Authenticate using AccessKey or AuthToken to obtain JWT tokens.
@@ -286,16 +460,15 @@ class LaraClient:
         """Authenticate using AccessKey with challenge-response."""
         path = '/v2/auth'
         method = 'POST'
-        date = datetime.datetime.now(datetime.timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        date = _http_date()
         content_type = 'application/json'
 
         body = {'id': self._auth.id}
-        body_string = json.dumps(body, ensure_ascii=False, separators=(',', ':'))
-        body_bytes = body_string.encode('UTF-8')
+        body_bytes = _json_dumps(body)
 
-        content_md5 = base64.b64encode(hashlib.md5(body_bytes).digest()).decode('UTF-8')
+        content_md5 = base64.b64encode(_md5(body_bytes).digest()).decode('UTF-8')
         challenge = self._compute_signature(
-            self._auth.secret,
+            self._secret_bytes,
             method,
             path,
             content_md5,
@@ -312,10 +485,10 @@ class LaraClient:
             'X-Lara-SDK-Version': self.sdk_version
         }
 
-        response = self.session.post(f'{self.base_url}{path}', headers=headers, data=body_string)
+        response = self.session.post(f'{self.base_url}{path}', headers=headers, data=body_bytes)
 
         if 200 <= response.status_code < 300:
-            data = response.json()
+            data = _json_loads(response.content)
             self._token = data.get('token')
             self._refresh_token = response.headers.get('x-lara-refresh-token')
 
@@ -338,7 +511,7 @@ class LaraClient:
         response = self.session.post(f'{self.base_url}{path}', headers=headers)
 
         if 200 <= response.status_code < 300:
-            data = response.json()
+            data = _json_loads(response.content)
             self._token = data.get('token')
 
             # Update refresh token if a new one is provided
@@ -352,12 +525,11 @@ class LaraClient:
             # Refresh failed, raise the error
             raise LaraApiError.from_response(response)
 
-    def _compute_signature(self, secret: str, method: str, path: str, content_md5: str,
+    def _compute_signature(self, secret: bytes, method: str, path: str, content_md5: str,
                           content_type: str, date: str) -> str:
         """Compute HMAC-SHA256 signature for challenge-response authentication."""
         challenge = f'{method}\n{path}\n{content_md5}\n{content_type}\n{date}'
-        secret_bytes = secret.encode('UTF-8')
         challenge_bytes = challenge.encode('UTF-8')
 
-        signature = hmac.new(secret_bytes, challenge_bytes, hashlib.sha256).digest()
+        signature = hmac.digest(secret, challenge_bytes, 'sha256')
         return base64.b64encode(signature).decode('UTF-8')
@@ -13,6 +13,7 @@ class AccessKey:
     IMPORTANT: Do not hard-code your access key ID and secret in your code. Always use environment variables or
     a credentials file. The access key secret is used to generate a challenge signature for authentication.
     """
+    __slots__ = ('_id', '_secret')
 
     def __init__(self, id: str, secret: str):
         """
@@ -70,6 +71,7 @@ class AuthToken:
     Use this class when you already have a valid JWT token and refresh token,
     for example from a previous authentication or from another authentication service.
     """
+    __slots__ = ('_token', '_refresh_token')
 
     def __init__(self, token: str, refresh_token: str):
         """
@@ -105,6 +107,7 @@ class Credentials(AccessKey):
     This class extends AccessKey and provides deprecated getter methods.
     Will be removed in a future version.
     """
+    __slots__ = ()
 
     def __init__(self, access_key_id: Optional[str] = None, access_key_secret: Optional[str] = None):
         """
@@ -5,7 +5,14 @@ class LaraError(Exception):
 class LaraApiError(LaraError):
     @classmethod
     def from_response(cls, response):
-        body = response.json()
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+
+        # Gateways and proxies answer with an HTML or empty body
+        if not isinstance(body, dict):
+            return cls(response.status_code, 'UnknownError', response.text or 'An unknown error occurred')
 
         _type = body.get('type', 'UnknownError')
         message = body.get('message', 'An unknown error occurred')
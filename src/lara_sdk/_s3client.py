@@ -1,5 +1,9 @@
-from typing import IO, TypedDict
+import io
+import os
+import uuid
+from typing import IO, TypedDict, Optional, Union, Dict, Iterator
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class S3UploadFields(TypedDict):
@@ -8,27 +12,140 @@ class S3UploadFields(TypedDict):
     key: str
 
 
+DownloadDestination = Union[str, os.PathLike, IO[bytes]]
+
+
 class S3Client():
-    def __init__(self):
-        self._session = requests.Session()
+    _DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
 
-    def upload(self, url: str, fields: S3UploadFields, file_payload: IO[bytes]) -> None:
-        files_dict = {'file': file_payload}
+    def __init__(self, session: Optional[requests.Session] = None):
+        if session is None:
+            # Keep-alive connection pool large enough for concurrent uploads and downloads
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+        self._session: requests.Session = session
 
+    def close(self) -> None:
+        self._session.close()
+
+    def upload(self, url: str, fields: S3UploadFields, file_payload: IO[bytes]) -> None:
         data_fields = {key: str(value) for key, value in fields.items()}
+        body = _MultipartBody(data_fields, file_payload)
 
         try:
-            response = self._session.post(url, data=data_fields, files=files_dict)
+            response = self._session.post(url, data=body, headers={'Content-Type': body.content_type})
 
             response.raise_for_status()
         except requests.RequestException as e:
             raise e
 
-    def download(self, url: str) -> bytes:
+    def download(self, url: str, dest: Optional[DownloadDestination] = None) -> Optional[bytes]:
+        """
+        Downloads the content at url. If dest (a path or a binary file-like object) is given, the content is
+        streamed into it in chunks and None is returned, otherwise the whole content is returned as bytes.
+        """
         try:
-            response = self._session.get(url)
-            response.raise_for_status()
-            return response.content
+            if dest is None:
+                response = self._session.get(url)
+                response.raise_for_status()
+                return response.content
+
+            with self._session.get(url, stream=True) as response:
+                response.raise_for_status()
+
+                write_response_content(response, dest, self._DOWNLOAD_CHUNK_SIZE)
+            return None
         except requests.RequestException as e:
             raise e
 
+
+def write_response_content(response: requests.Response, dest: DownloadDestination, chunk_size: int) -> None:
+    """
+    Writes the body of a streamed response into dest (a path or a binary file-like object), chunk by chunk.
+    """
+    if isinstance(dest, (str, os.PathLike)):
+        with open(dest, 'wb') as output:
+            write_response_content(response, output, chunk_size)
+        return
+
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        dest.write(chunk)
+
+
+class _MultipartBody:
+    """
+    A multipart/form-data body made of the given fields followed by the file, which is read from file_payload
+    while the request is sent instead of being loaded in memory. The total length is known upfront, so the
+    request still carries a Content-Length (required by S3).
+    """
+    _CHUNK_SIZE: int = 1024 * 1024
+
+    def __init__(self, fields: Dict[str, str], file_payload: IO[bytes]):
+        boundary = uuid.uuid4().hex
+        self.content_type: str = f'multipart/form-data; boundary={boundary}'
+
+        filename = os.path.basename(getattr(file_payload, 'name', None) or 'file')
+        filename = filename.replace('\\', '\\\\').replace('"', '%22')
+
+        head = b''.join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode('UTF-8')
+            for name, value in fields.items()
+        )
+        head += f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n\r\n'.encode('UTF-8')
+        tail = f'\r\n--{boundary}--\r\n'.encode('UTF-8')
+
+        self._file_start: int = file_payload.tell()
+        self._file_size: int = file_payload.seek(0, os.SEEK_END) - self._file_start
+        file_payload.seek(self._file_start)
+
+        self._head_size: int = len(head)
+        self._head: io.BytesIO = io.BytesIO(head)
+        self._file: IO[bytes] = file_payload
+        self._tail: io.BytesIO = io.BytesIO(tail)
+        self._length: int = self._head_size + self._file_size + len(tail)
+        self._position: int = 0
+        self._parts = [self._head, self._file, self._tail]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Being iterable makes requests treat the body as a stream, which it rewinds (with tell/seek) to resend
+        # it on a 307/308 redirect
+        return iter(lambda: self.read(self._CHUNK_SIZE), b'')
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        position = min(max(offset, 0), self._length)
+
+        self._head.seek(min(position, self._head_size))
+        self._file.seek(self._file_start + min(max(position - self._head_size, 0), self._file_size))
+        self._tail.seek(max(position - self._head_size - self._file_size, 0))
+
+        self._parts = [self._head, self._file, self._tail]
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and (size < 0 or size > 0):
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+
+        data = b''.join(chunks)
+        self._position += len(data)
+        return data
@@ -1,16 +1,36 @@
+import copy
+import hashlib
+import random
+import shutil
+import sys
+import tempfile
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Union, List, Iterable, Callable, Literal, Dict
-from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional, Union, List, Iterable, Iterator, Callable, Literal, Dict, Tuple, TypeVar, Type
+from dataclasses import dataclass, field
 import mimetypes
+import os
 from pathlib import Path
 import json
 
-from ._client import LaraObject, LaraClient
+from requests.exceptions import ConnectionError as _ConnectionError, Timeout
+
+from ._client import LaraObject, LaraClient, LazyDate, _json_dumps
 from ._credentials import Credentials, AccessKey, AuthToken
 from ._errors import LaraApiError
-from ._s3client import S3Client, S3UploadFields
+from ._s3client import S3Client, S3UploadFields, DownloadDestination
+
+try:
+    # ISA-L compresses gzip several times faster than zlib, when installed
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
 
 TranslationStyle = Literal["faithful", "fluid", "creative"]
 ProfanitiesDetect = Literal["target", "source_target"]
@@ -18,24 +38,39 @@ ProfanitiesHandling = Literal["hide", "avoid", "detect"]
 GlossaryFileFormat = Literal["csv/table-uni", "csv/table-multi"]
 MemoryExportFormat = Literal["tmx", "jtm"]
 
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
 # Objects --------------------------------------------------------------------------------------------------------------
 
 
 class Memory(LaraObject):
+    __slots__ = ('id', '_created_at', '_updated_at', 'name', 'external_id', 'secret', 'owner_id',
+                 'collaborators_count', '_shared_at', 'is_personal')
+
+    created_at = LazyDate()
+    updated_at = LazyDate()
+    shared_at = LazyDate()
+
     def __init__(self, **kwargs):
         self.id: str = kwargs.get('id')
-        self.created_at: datetime = self._parse_date(kwargs.get('created_at', None))
-        self.updated_at: datetime = self._parse_date(kwargs.get('updated_at', None))
+        self.created_at: datetime = kwargs.get('created_at', None)
+        self.updated_at: datetime = kwargs.get('updated_at', None)
         self.name: str = kwargs.get('name')
         self.external_id: Optional[str] = kwargs.get('external_id', None)
         self.secret: Optional[str] = kwargs.get('secret', None)
         self.owner_id: str = kwargs.get('owner_id')
         self.collaborators_count: int = kwargs.get('collaborators_count')
-        self.shared_at: datetime = self._parse_date(kwargs.get('shared_at'))
+        self.shared_at: datetime = kwargs.get('shared_at')
         self.is_personal: bool = kwargs.get('is_personal')
 
 
-class MemoryImport(LaraObject):
+class _ImportJob(LaraObject):
+    """
+    Progress of an asynchronous content import, shared by memories and glossaries.
+    """
+    __slots__ = ('id', 'begin', 'end', 'channel', 'size', 'progress')
+
     def __init__(self, **kwargs):
         self.id: str = kwargs.get('id')
         self.begin: int = kwargs.get('begin')
@@ -44,29 +79,46 @@ class MemoryImport(LaraObject):
         self.size: int = kwargs.get('size')
         self.progress: float = kwargs.get('progress')
 
+
+class MemoryImport(_ImportJob):
+    __slots__ = ()
+
 class MemoryExport(LaraObject):
+    __slots__ = ('job_id',)
+
     def __init__(self, **kwargs):
         self.job_id: str = kwargs.get('job_id')
 
+@dataclass
+class MemoryTranslation:
+    source: str
+    target: str
+    sentence: str
+    translation: str
+    tuid: Optional[str] = None
+    sentence_before: Optional[str] = None
+    sentence_after: Optional[str] = None
+
 class Glossary(LaraObject):
+    __slots__ = ('id', 'name', 'owner_id', '_created_at', '_updated_at', 'is_personal')
+
+    created_at = LazyDate()
+    updated_at = LazyDate()
+
     def __init__(self, **kwargs):
         self.id: str = kwargs.get('id')
         self.name: str = kwargs.get('name')
         self.owner_id: str = kwargs.get('owner_id')
-        self.created_at: datetime = self._parse_date(kwargs.get('created_at', None))
-        self.updated_at: datetime = self._parse_date(kwargs.get('updated_at', None))
+        self.created_at: datetime = kwargs.get('created_at')
+        self.updated_at: datetime = kwargs.get('updated_at')
         self.is_personal: bool = kwargs.get('is_personal')
 
-class GlossaryImport(LaraObject):
-    def __init__(self, **kwargs):
-        self.id: str = kwargs.get('id')
-        self.begin: int = kwargs.get('begin')
-        self.end: int = kwargs.get('end')
-        self.channel: int = kwargs.get('channel')
-        self.size: int = kwargs.get('size')
-        self.progress: float = kwargs.get('progress')
+class GlossaryImport(_ImportJob):
+    __slots__ = ()
 
 class GlossaryCounts(LaraObject):
+    __slots__ = ('unidirectional', 'multidirectional')
+
     def __init__(self, **kwargs):
         self.unidirectional: Optional[Dict[str, int]] = kwargs.get('unidirectional')
         self.multidirectional: Optional[int] = kwargs.get('multidirectional')
@@ -77,13 +129,18 @@ class GlossaryTerm:
     value: str
 
 class Styleguide(LaraObject):
+    __slots__ = ('id', 'name', 'owner_id', 'content', '_created_at', '_updated_at', 'is_personal')
+
+    created_at = LazyDate()
+    updated_at = LazyDate()
+
     def __init__(self, **kwargs):
         self.id: str = kwargs.get('id')
         self.name: str = kwargs.get('name')
         self.owner_id: str = kwargs.get('owner_id')
         self.content: Optional[str] = kwargs.get('content', None)
-        self.created_at: datetime = self._parse_date(kwargs.get('created_at', None))
-        self.updated_at: datetime = self._parse_date(kwargs.get('updated_at', None))
+        self.created_at: datetime = kwargs.get('created_at')
+        self.updated_at: datetime = kwargs.get('updated_at')
         self.is_personal: bool = kwargs.get('is_personal')
 
 @dataclass
@@ -111,15 +168,21 @@ class DocxExtractionParams:
 DocumentExtractionParams = Union[DocxExtractionParams]
 
 class Document(LaraObject):
+    __slots__ = ('id', 'status', 'source', 'target', 'filename', '_created_at', '_updated_at', 'options',
+                 'translated_chars', 'total_chars', 'error_reason')
+
+    created_at = LazyDate()
+    updated_at = LazyDate()
 
     def __init__(self, **kwargs):
         self.id: str = kwargs.get('id')
-        self.status: DocumentStatus = DocumentStatus(kwargs.get('status'))
+        status = kwargs.get('status')
+        self.status: DocumentStatus = _DOCUMENT_STATUSES.get(status) or DocumentStatus(status)
         self.source: Optional[str] = kwargs.get('source')
         self.target: str = kwargs.get('target')
         self.filename: str = kwargs.get('filename')
-        self.created_at: datetime = self._parse_date(kwargs.get('created_at'))
-        self.updated_at: datetime = self._parse_date(kwargs.get('updated_at'))
+        self.created_at: datetime = kwargs.get('created_at')
+        self.updated_at: datetime = kwargs.get('updated_at')
         self.options: Optional[DocumentOptions] = DocumentOptions(**kwargs.get('options')) if kwargs.get('options') else None
         self.translated_chars: Optional[int] = int(kwargs.get('translated_chars')) if kwargs.get('translated_chars') else None
         self.total_chars: Optional[int] = int(kwargs.get('total_chars')) if kwargs.get('total_chars') else None
@@ -127,17 +190,23 @@ class Document(LaraObject):
 
 
 class TextBlock(LaraObject):
+    __slots__ = ('text', 'translatable')
+
     def __init__(self, **kwargs):
         self.text: str = kwargs.get('text')
         self.translatable: bool = kwargs.get('translatable', True)
 
 class ProfanityDetectResult(LaraObject):
+    __slots__ = ('masked_text', 'profanities', 'error')
+
     def __init__(self, **kwargs):
         self.masked_text: str = kwargs.get('masked_text')
         self.profanities: List[dict] = kwargs.get('profanities', [])
         self.error: Optional[str] = kwargs.get('error')
 
 class ProfanitiesResult(LaraObject):
+    __slots__ = ('target', 'source')
+
     def __init__(self, **kwargs):
         self.target: Optional[Union[ProfanityDetectResult, List[Optional[ProfanityDetectResult]]]] = None
         self.source: Optional[Union[ProfanityDetectResult, List[Optional[ProfanityDetectResult]]]] = None
@@ -155,6 +224,8 @@ class ProfanitiesResult(LaraObject):
             self.source = [ProfanityDetectResult(**p) if p is not None else None for p in raw_source]
 
 class StyleguideChange(LaraObject):
+    __slots__ = ('id', 'original_translation', 'refined_translation', 'explanation')
+
     def __init__(self, **kwargs):
         self.id: Optional[str] = kwargs.get('id')
         self.original_translation: str = kwargs.get('original_translation')
@@ -162,15 +233,21 @@ class StyleguideChange(LaraObject):
         self.explanation: str = kwargs.get('explanation')
 
 class StyleguideResults(LaraObject):
+    __slots__ = ('original_translation', 'changes')
+
     def __init__(self, **kwargs):
         self.original_translation: Optional[Union[str, List[str], List[TextBlock]]] = kwargs.get('original_translation')
         self.changes: List[StyleguideChange] = [StyleguideChange(**c) for c in kwargs.get('changes', [])]
 
 class QualityEstimationResult(LaraObject):
+    __slots__ = ('score',)
+
     def __init__(self, **kwargs):
         self.score: float = kwargs.get('score')
 
 class NGMemoryMatch(LaraObject):
+    __slots__ = ('memory', 'tuid', 'language', 'sentence', 'translation')
+
     def __init__(self, **kwargs):
         self.memory: str = kwargs.get('memory')
         self.tuid: Optional[str] = kwargs.get('tuid') if kwargs.get('tuid') else None
@@ -179,16 +256,34 @@ class NGMemoryMatch(LaraObject):
         self.translation: float = kwargs.get('translation')
 
 class NGGlossaryMatch(LaraObject):
+    __slots__ = ('glossary', 'language', 'term', 'translation')
+
     def __init__(self, **kwargs):
         self.glossary: str = kwargs.get('glossary')
         self.language: List[str] = kwargs.get('language')
         self.term: str = kwargs.get('term')
         self.translation: str = kwargs.get('translation')
 
+def _parse_matches(matches: list, match_class: Type[_T]) -> Union[List[_T], List[Optional[List[_T]]]]:
+    # Matches of a single text are a flat list of objects, matches of multiple texts have one list (or None) per
+    # text: the first element tells which one this is
+    if not matches or isinstance(matches[0], dict):
+        return [match_class(**m) for m in matches]
+    return [[match_class(**m) for m in text_matches] if isinstance(text_matches, list) else None
+            for text_matches in matches]
+
+
 class TextResult(LaraObject):
+    # translation is assigned last in __init__, so it is listed last to keep the repr order
+    __slots__ = ('content_type', 'source_language', 'adapted_to', 'glossaries', 'adapted_to_matches',
+                 'glossaries_matches', 'profanities', 'styleguide_results', 'translation')
+
     def __init__(self, **kwargs):
-        self.content_type: str = kwargs.get('content_type')
-        self.source_language: str = kwargs.get('source_language')
+        # Content types and language codes are a small set of values repeated across results
+        content_type = kwargs.get('content_type')
+        source_language = kwargs.get('source_language')
+        self.content_type: str = sys.intern(content_type) if isinstance(content_type, str) else content_type
+        self.source_language: str = sys.intern(source_language) if isinstance(source_language, str) else source_language
         self.translation: Union[str, List[str], List[TextBlock]]
         self.adapted_to: Optional[List[str]] = kwargs.get('adapted_to', None)
         self.glossaries: Optional[List[str]] = kwargs.get('glossaries', None)
@@ -207,58 +302,202 @@ class TextResult(LaraObject):
         if raw_styleguide_results is not None:
             self.styleguide_results = StyleguideResults(**raw_styleguide_results)
 
-        # Parse adapted_to_matches
+        # Parse adapted_to_matches and glossaries_matches
         adapted_to_matches = kwargs.get('adapted_to_matches', None)
         if adapted_to_matches is not None:
-            if any(isinstance(m, list) for m in adapted_to_matches):
-                self.adapted_to_matches = [
-                    [NGMemoryMatch(**m) for m in matches] if isinstance(matches, list) else None
-                    for matches in adapted_to_matches
-                ]
-            else:
-                self.adapted_to_matches = [NGMemoryMatch(**m) for m in adapted_to_matches]
+            self.adapted_to_matches = _parse_matches(adapted_to_matches, NGMemoryMatch)
 
-        # Parse glossaries_matches
         glossaries_matches = kwargs.get('glossaries_matches', None)
         if glossaries_matches is not None:
-            if any(isinstance(m, list) for m in glossaries_matches):
-                self.glossaries_matches = [
-                    [NGGlossaryMatch(**m) for m in matches] if isinstance(matches, list) else None
-                    for matches in glossaries_matches
-                ]
-            else:
-                self.glossaries_matches = [NGGlossaryMatch(**m) for m in glossaries_matches]
+            self.glossaries_matches = _parse_matches(glossaries_matches, NGGlossaryMatch)
 
         # Parse translation
         translation = kwargs.get('translation')
         if isinstance(translation, str):
             self.translation = translation
         elif isinstance(translation, list):
-            if all(isinstance(e, str) for e in translation):
+            # The API never mixes strings and blocks: the first element tells which kind of list this is
+            if not translation or isinstance(translation[0], str):
                 self.translation = translation
             else:
-                self.translation = [TextBlock(**e) for e in translation]
+                self.translation = [TextBlock(text=e.get('text'), translatable=e.get('translatable', True))
+                                    for e in translation]
 
 
 class DetectPrediction(LaraObject):
+    __slots__ = ('language', 'confidence')
+
     def __init__(self, **kwargs):
         self.language: str = kwargs.get('language')
         self.confidence: float = kwargs.get('confidence')
 
 class DetectResult(LaraObject):
+    __slots__ = ('language', 'content_type', 'predictions')
+
     def __init__(self, **kwargs):
         self.language: str = kwargs.get('language')
         self.content_type: str = kwargs.get('content_type')
         self.predictions: List[DetectPrediction] = [DetectPrediction(**p) for p in kwargs.get('predictions', [])]
 
+@dataclass
+class DetectRequest:
+    text: Union[str, List[str]]
+    hint: Optional[str] = None
+    passlist: Optional[List[str]] = None
+
 
 # Translator SDK -------------------------------------------------------------------------------------------------------
 
 
+def _polling_intervals(min_interval: float, max_interval: float) -> Iterator[float]:
+    """
+    Yields polling sleep intervals: jittered exponential backoff from min_interval to max_interval.
+    """
+    interval = min_interval
+    while True:
+        yield interval * random.uniform(.8, 1.2)
+        interval = min(interval * 2, max_interval)
+
+
+# Consecutive failed status checks tolerated while waiting for an import
+_MAX_TRANSIENT_FAILURES = 5
+
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, LaraApiError):
+        return error.status_code >= 500
+    return isinstance(error, (_ConnectionError, Timeout))
+
+
+def _wait_for_imports(get_status: Callable[[str], _T], jobs: Iterable[_T],
+                      update_callback: Optional[Callable[[_T], None]], max_wait_time: float,
+                      min_interval: float, max_interval: float, max_workers: int = 8) -> List[_T]:
+    """
+    Polls import jobs until all of them complete, tolerating transient errors.
+    """
+    jobs = list(jobs)
+    pending = [i for i, job in enumerate(jobs) if job.progress < 1.]
+
+    start = time.monotonic()
+    # Last progress seen for each job, and when: (time, progress)
+    observed = {i: (start, jobs[i].progress) for i in pending}
+    intervals = _polling_intervals(min_interval, max_interval)
+    delay = next(intervals)
+    failures = 0
+    while pending:
+        if 0 < max_wait_time < time.monotonic() - start:
+            raise TimeoutError()
+
+        time.sleep(delay)
+
+        try:
+            updates = _map_concurrently(lambda i: get_status(jobs[i].id), pending, max_workers)
+        except Exception as e:
+            failures += 1
+            if failures > _MAX_TRANSIENT_FAILURES or not _is_transient_error(e):
+                raise
+            delay = next(intervals)
+            continue
+
+        failures = 0
+        now = time.monotonic()
+        remaining = []
+        for i, job in zip(pending, updates):
+            jobs[i] = job
+            if update_callback is not None:
+                update_callback(job)
+
+            last_time, last_progress = observed[i]
+            if last_progress < job.progress < 1.:
+                # Half the time still needed at the current rate, so that the end is not overshot
+                remaining.append((1. - job.progress) * (now - last_time) / (job.progress - last_progress) / 2)
+                observed[i] = (now, job.progress)
+        pending = [i for i in pending if jobs[i].progress < 1.]
+
+        if remaining:
+            delay = min(max(min(remaining), min_interval), max_interval)
+        else:
+            delay = next(intervals)
+
+    return jobs
+
+
+def _map_concurrently(fn: Callable[[_T], _R], items: List[_T], max_workers: int) -> List[_R]:
+    """
+    Applies fn to every item on a thread pool, returning the results in order.
+    """
+    if len(items) < 2 or max_workers < 2:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _build_tu_body(source: str, target: str, sentence: Optional[str], translation: Optional[str],
+                   tuid: Optional[str], sentence_before: Optional[str], sentence_after: Optional[str]) -> Dict:
+    """
+    Returns the request body of a memory translation unit, with only the optional fields that are set.
+    """
+    body = {'source': source, 'target': target}
+    for key, value in (('sentence', sentence), ('translation', translation), ('tuid', tuid),
+                       ('sentence_before', sentence_before), ('sentence_after', sentence_after)):
+        if value is not None:
+            body[key] = value
+    return body
+
+
+def _gzip_compressor(level: int):
+    if isal_zlib is not None:
+        # ISA-L only has levels 0 to 3: the zlib 1-9 scale is mapped onto them
+        isal_level = 2 if level < 0 else min(3, (level + 2) // 3)
+        return isal_zlib.compressobj(isal_level, isal_zlib.DEFLATED, 16 + isal_zlib.MAX_WBITS)
+    return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class _GzipStream:
+    """
+    A read-only stream with the gzip-compressed content of another binary stream.
+    """
+    _BUFFER_SIZE: int = 128 * 1024
+
+    def __init__(self, stream, level: int = 6):
+        self.name: Optional[str] = getattr(stream, 'name', None)
+        self._stream = stream
+        self._compressor = _gzip_compressor(level)
+        self._buffer: bytearray = bytearray(self._BUFFER_SIZE)
+        self._view: memoryview = memoryview(self._buffer)
+        self._pending: bytearray = bytearray()
+        self._eof: bool = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._pending) < size):
+            n = self._stream.readinto(self._buffer)
+            if n:
+                self._pending += self._compressor.compress(self._view[:n])
+            else:
+                self._pending += self._compressor.flush()
+                self._eof = True
+
+        if size < 0 or size >= len(self._pending):
+            data = bytes(self._pending)
+            self._pending.clear()
+        else:
+            with memoryview(self._pending) as pending:
+                data = pending[:size].tobytes()
+            del self._pending[:size]
+        return data
+
+
 class Memories:
-    def __init__(self, client: LaraClient):
+    _get_cache_size: int = 256
+
+    def __init__(self, client: LaraClient, lookup_cache_ttl: float = 0):
         self._client: LaraClient = client
-        self._polling_interval: int = 2
+        self._min_polling_interval: float = .25
+        self._max_polling_interval: float = 4.
+        # Raw responses of get(), by memory id, kept for lookup_cache_ttl seconds (not cached if 0)
+        self._get_cache_ttl: float = lookup_cache_ttl
+        self._get_cache: _TTLCache = _TTLCache(self._get_cache_size)
 
     def list(self) -> List[Memory]:
         return [Memory(**e) for e in self._client.get('/v2/memories')]
@@ -268,23 +507,41 @@ class Memories:
             'name': name, 'external_id': external_id
         }))
 
-    def get(self, id_: str) -> Optional[Memory]:
-        try:
-            return Memory(**self._client.get(f'/v2/memories/{id_}'))
-        except LaraApiError as e:
-            if e.status_code == 404:
-                return None
-            raise
+    def get(self, id_: str, *, force_refresh: bool = False) -> Optional[Memory]:
+        """
+        Returns the memory with the given id, or None if it does not exist.
+        """
+        data = None if force_refresh else self._get_cache.get(id_)
+        if data is None:
+            try:
+                data = self._client.get(f'/v2/memories/{id_}')
+            except LaraApiError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+            self._get_cache.put(id_, data, self._get_cache_ttl)
+
+        return Memory(**data)
 
     def delete(self, id_: str) -> Memory:
+        self._get_cache.pop(id_)
         return Memory(**self._client.delete(f'/v2/memories/{id_}'))
 
     def update(self, id_: str, name: str) -> Memory:
+        self._get_cache.pop(id_)
         return Memory(**self._client.put(f'/v2/memories/{id_}', {
             'name': name
         }))
 
+    def _invalidate(self, id_: Union[str, List[str]]) -> None:
+        for memory_id in (id_ if isinstance(id_, (list, tuple)) else (id_,)):
+            self._get_cache.pop(memory_id)
+
     def connect(self, ids: Union[str, List[str]]) -> Union[Optional[Memory], List[Memory]]:
+        # Nothing to connect: skip the request
+        if not ids:
+            return [] if isinstance(ids, list) else None
+
         results = [Memory(**e) for e in self._client.post('/v2/memories/connect', {
             'ids': ids if isinstance(ids, list) else [ids]
         })]
@@ -294,39 +551,71 @@ class Memories:
         return results[0] if len(results) > 0 else None
 
     def import_tmx(self, id_: str, tmx: str, *, callback_url: Optional[str] = None,
-                   gzip: bool = False) -> MemoryImport:
+                   gzip: bool = False, compress: bool = False, compression_level: int = 6) -> MemoryImport:
+        """
+        Imports a TMX file into a memory, optionally gzip-compressed (gzip) or compressed while uploading.
+        """
+        if gzip and compress:
+            raise ValueError('gzip and compress cannot be used together')
+
         with open(tmx, 'rb') as stream:
             body = {}
-            if gzip:
+            if gzip or compress:
                 body['compression'] = 'gzip'
             if callback_url is not None:
                 body['callback_url'] = callback_url
-            return MemoryImport(**self._client.post(f'/v2/memories/{id_}/import', body, {'tmx': stream}))
+            payload = _GzipStream(stream, compression_level) if compress else stream
+            self._get_cache.pop(id_)
+            return MemoryImport(**self._client.post(f'/v2/memories/{id_}/import', body, {'tmx': payload}))
 
     def add_translation(self, id_: Union[str, List[str]], source: str, target: str, sentence: str, translation: str,
                         *, tuid: str = None, sentence_before: str = None, sentence_after: str = None,
                         headers: Optional[Dict[str, str]] = None) -> MemoryImport:
-        body = {'source': source, 'target': target, 'sentence': sentence, 'translation': translation,
-                'tuid': tuid, 'sentence_before': sentence_before, 'sentence_after': sentence_after}
+        body = _build_tu_body(source, target, sentence, translation, tuid, sentence_before, sentence_after)
+        self._invalidate(id_)
 
-        if isinstance(id_, list):
-            body['ids'] = id_
+        # Multiple memories are updated by a single job, with one request
+        if isinstance(id_, (list, tuple)):
+            body['ids'] = list(id_)
             return MemoryImport(**self._client.put('/v2/memories/content', body, headers=headers))
         return MemoryImport(**self._client.put(f'/v2/memories/{id_}/content', body, headers=headers))
 
+    def add_translations(self, id_: Union[str, List[str]], translations: Iterable[MemoryTranslation], *,
+                         headers: Optional[Dict[str, str]] = None, max_workers: int = 8) -> List[MemoryImport]:
+        """
+        Adds multiple translation units to one or more memories, returning the import jobs in order.
+        """
+        return _map_concurrently(
+            lambda t: self.add_translation(id_, t.source, t.target, t.sentence, t.translation, tuid=t.tuid,
+                                           sentence_before=t.sentence_before, sentence_after=t.sentence_after,
+                                           headers=headers),
+            list(translations), max_workers)
+
     def delete_translation(self, id_: Union[str, List[str]], source: str, target: str,
                            *, sentence: Optional[str] = None, translation: Optional[str] = None,
                            tuid: Optional[str] = None, sentence_before: Optional[str] = None,
                            sentence_after: Optional[str] = None
                            ) -> MemoryImport:
-        body = {'source': source, 'target': target, 'sentence': sentence, 'translation': translation,
-                'tuid': tuid, 'sentence_before': sentence_before, 'sentence_after': sentence_after}
+        body = _build_tu_body(source, target, sentence, translation, tuid, sentence_before, sentence_after)
+        self._invalidate(id_)
 
-        if isinstance(id_, list):
-            body['ids'] = id_
+        # Multiple memories are updated by a single job, with one request
+        if isinstance(id_, (list, tuple)):
+            body['ids'] = list(id_)
             return MemoryImport(**self._client.delete('/v2/memories/content', body))
         return MemoryImport(**self._client.delete(f'/v2/memories/{id_}/content', body))
 
+    def delete_translations(self, id_: Union[str, List[str]], translations: Iterable[MemoryTranslation], *,
+                            max_workers: int = 8) -> List[MemoryImport]:
+        """
+        Deletes multiple translation units from one or more memories, returning the import jobs in order.
+        """
+        return _map_concurrently(
+            lambda t: self.delete_translation(id_, t.source, t.target, sentence=t.sentence,
+                                              translation=t.translation, tuid=t.tuid,
+                                              sentence_before=t.sentence_before, sentence_after=t.sentence_after),
+            list(translations), max_workers)
+
     def get_import_status(self, id_: str) -> MemoryImport:
         return MemoryImport(**self._client.get(f'/v2/memories/imports/{id_}'))
 
@@ -339,23 +628,31 @@ class Memories:
     def wait_for_import(self, memory_import: MemoryImport, *,
                         update_callback: Callable[[MemoryImport], None] = None,
                         max_wait_time: float = 0) -> MemoryImport:
-        start = time.time()
-        while memory_import.progress < 1.:
-            if 0 < max_wait_time < time.time() - start:
-                raise TimeoutError()
-
-            time.sleep(self._polling_interval)
+        return self.wait_for_imports([memory_import], update_callback=update_callback, max_wait_time=max_wait_time)[0]
 
-            memory_import = self.get_import_status(memory_import.id)
-            if update_callback is not None:
-                update_callback(memory_import)
-
-        return memory_import
+    def wait_for_imports(self, memory_imports: Iterable[MemoryImport], *,
+                         update_callback: Callable[[MemoryImport], None] = None,
+                         max_wait_time: float = 0, max_workers: int = 8) -> List[MemoryImport]:
+        """
+        Waits for multiple imports at once, returning them in order.
+        """
+        jobs = _wait_for_imports(self.get_import_status, memory_imports, update_callback, max_wait_time,
+                                 self._min_polling_interval, self._max_polling_interval, max_workers)
+        # Import jobs do not tell which memory they changed: cached lookups may all be outdated now
+        self._get_cache.clear()
+        return jobs
 
 class Glossaries:
-    def __init__(self, client: LaraClient):
+    _get_cache_size: int = 256
+
+    def __init__(self, client: LaraClient, lookup_cache_ttl: float = 0):
         self._client: LaraClient = client
-        self._polling_interval: int = 2
+        self._min_polling_interval: float = .25
+        self._max_polling_interval: float = 4.
+        # Raw responses of get() and counts(), by (endpoint, glossary id), kept for lookup_cache_ttl seconds
+        # (not cached if 0)
+        self._get_cache_ttl: float = lookup_cache_ttl
+        self._get_cache: _TTLCache = _TTLCache(self._get_cache_size)
 
     def list(self) -> List[Glossary]:
         return [Glossary(**e) for e in self._client.get('/v2/glossaries')]
@@ -365,30 +662,52 @@ class Glossaries:
             'name': name
         }))
 
-    def get(self, id_: str) -> Optional[Glossary]:
-        try:
-            return Glossary(**self._client.get(f'/v2/glossaries/{id_}'))
-        except LaraApiError as e:
-            if e.status_code == 404:
-                return None
-            raise
+    def get(self, id_: str, *, force_refresh: bool = False) -> Optional[Glossary]:
+        """
+        Returns the glossary with the given id, or None if it does not exist.
+        """
+        data = None if force_refresh else self._get_cache.get(('get', id_))
+        if data is None:
+            try:
+                data = self._client.get(f'/v2/glossaries/{id_}')
+            except LaraApiError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+            self._get_cache.put(('get', id_), data, self._get_cache_ttl)
+
+        return Glossary(**data)
 
     def delete(self, id_: str) -> Glossary:
+        self._invalidate(id_)
         return Glossary(**self._client.delete(f'/v2/glossaries/{id_}'))
 
     def update(self, id_: str, name: str) -> Glossary:
+        self._invalidate(id_)
         return Glossary(**self._client.put(f'/v2/glossaries/{id_}', {
             'name': name
         }))
 
+    def _invalidate(self, id_: str) -> None:
+        self._get_cache.pop(('get', id_))
+        self._get_cache.pop(('counts', id_))
+
     def import_csv(self, id_: str, csv: str,
                    content_type: GlossaryFileFormat = "csv/table-uni",
-                   *, gzip: bool = False) -> GlossaryImport:
+                   *, gzip: bool = False, compress: bool = False, compression_level: int = 6) -> GlossaryImport:
+        """
+        Imports a CSV file into a glossary, optionally gzip-compressed (gzip) or compressed while uploading.
+        """
+        if gzip and compress:
+            raise ValueError('gzip and compress cannot be used together')
+
         with open(csv, 'rb') as stream:
             body = {'content_type': content_type}
-            if gzip:
+            if gzip or compress:
                 body['compression'] = 'gzip'
-            return GlossaryImport(**self._client.post(f'/v2/glossaries/{id_}/import', body, {'csv': stream}))
+            payload = _GzipStream(stream, compression_level) if compress else stream
+            self._invalidate(id_)
+            return GlossaryImport(**self._client.post(f'/v2/glossaries/{id_}/import', body, {'csv': payload}))
 
     def get_import_status(self, id_: str) -> GlossaryImport:
         return GlossaryImport(**self._client.get(f'/v2/glossaries/imports/{id_}'))
@@ -396,36 +715,56 @@ class Glossaries:
     def wait_for_import(self, glossary_import: GlossaryImport, *,
                         update_callback: Callable[[GlossaryImport], None] = None,
                         max_wait_time: float = 0) -> GlossaryImport:
-        start = time.time()
-        while glossary_import.progress < 1.:
-            if 0 < max_wait_time < time.time() - start:
-                raise TimeoutError()
+        return self.wait_for_imports([glossary_import], update_callback=update_callback, max_wait_time=max_wait_time)[0]
 
-            time.sleep(self._polling_interval)
-
-            glossary_import = self.get_import_status(glossary_import.id)
-            if update_callback is not None:
-                update_callback(glossary_import)
+    def wait_for_imports(self, glossary_imports: Iterable[GlossaryImport], *,
+                         update_callback: Callable[[GlossaryImport], None] = None,
+                         max_wait_time: float = 0, max_workers: int = 8) -> List[GlossaryImport]:
+        """
+        Waits for multiple imports at once, returning them in order.
+        """
+        jobs = _wait_for_imports(self.get_import_status, glossary_imports, update_callback, max_wait_time,
+                                 self._min_polling_interval, self._max_polling_interval, max_workers)
+        # Import jobs do not tell which glossary they changed: cached lookups may all be outdated now
+        self._get_cache.clear()
+        return jobs
 
-        return glossary_import
+    def counts(self, id_: str, *, force_refresh: bool = False) -> GlossaryCounts:
+        """
+        Returns the number of entries in the glossary, cached (if enabled) like get().
+        """
+        data = None if force_refresh else self._get_cache.get(('counts', id_))
+        if data is None:
+            data = self._client.get(f'/v2/glossaries/{id_}/counts')
+            self._get_cache.put(('counts', id_), data, self._get_cache_ttl)
 
-    def counts(self, id_: str) -> GlossaryCounts:
-        return GlossaryCounts(**self._client.get(f'/v2/glossaries/{id_}/counts'))
+        return GlossaryCounts(**data)
 
 
-    def export(self, id_: str, content_type: GlossaryFileFormat, source: Optional[str] = None) -> bytes:
-        response = self._client.get(f'/v2/glossaries/{id_}/export', {
+    def export(self, id_: str, content_type: GlossaryFileFormat, source: Optional[str] = None, *,
+               dest: Optional[DownloadDestination] = None) -> Optional[bytes]:
+        """
+        Exports the glossary content, streamed into dest if given.
+        """
+        params = {
             'content_type': content_type,
             'source': source
-        })
-        return response
+        }
+
+        if dest is not None:
+            self._client.download(f'/v2/glossaries/{id_}/export', dest, params)
+            return None
+
+        return self._client.get(f'/v2/glossaries/{id_}/export', params)
 
     def add_or_replace_entry(self, id_: str, terms: List[GlossaryTerm], *, guid: Optional[str] = None) -> GlossaryImport:
-        body = {'terms': [term.__dict__ for term in terms], 'guid': guid}
+        body = {'terms': [{'language': term.language, 'value': term.value} for term in terms], 'guid': guid}
+        self._invalidate(id_)
         return GlossaryImport(**self._client.put(f'/v2/glossaries/{id_}/content', body))
 
     def delete_entry(self, id_: str, *, term: Optional[GlossaryTerm] = None, guid: Optional[str] = None) -> GlossaryImport:
-        body = {'term': term.__dict__ if term else None, 'guid': guid}
+        body = {'term': {'language': term.language, 'value': term.value} if term else None, 'guid': guid}
+        self._invalidate(id_)
         return GlossaryImport(**self._client.delete(f'/v2/glossaries/{id_}/content', body))
 
 
@@ -465,6 +804,11 @@ class AudioStatus(Enum):
     ERROR = 'error'
 
 
+# Statuses by API value, to skip the Enum constructor when building each Document/Audio
+_DOCUMENT_STATUSES: Dict[str, DocumentStatus] = {status.value: status for status in DocumentStatus}
+_AUDIO_STATUSES: Dict[str, AudioStatus] = {status.value: status for status in AudioStatus}
+
+
 class VoiceGender(Enum):
     MALE = 'male'
     FEMALE = 'female'
@@ -480,26 +824,51 @@ class AudioOptions:
 
 
 class Audio(LaraObject):
+    __slots__ = ('id', 'status', 'source', 'target', 'filename', '_created_at', '_updated_at', 'options',
+                 'translated_seconds', 'total_seconds', 'error_reason')
+
+    created_at = LazyDate()
+    updated_at = LazyDate()
 
     def __init__(self, **kwargs):
         self.id: str = kwargs.get('id')
-        self.status: AudioStatus = AudioStatus(kwargs.get('status'))
+        status = kwargs.get('status')
+        self.status: AudioStatus = _AUDIO_STATUSES.get(status) or AudioStatus(status)
         self.source: Optional[str] = kwargs.get('source')
         self.target: str = kwargs.get('target')
         self.filename: str = kwargs.get('filename')
-        self.created_at: datetime = self._parse_date(kwargs.get('created_at'))
-        self.updated_at: datetime = self._parse_date(kwargs.get('updated_at'))
+        self.created_at: datetime = kwargs.get('created_at')
+        self.updated_at: datetime = kwargs.get('updated_at')
         self.options: Optional[AudioOptions] = AudioOptions(**kwargs.get('options')) if kwargs.get('options') else None
         self.translated_seconds: Optional[int] = int(kwargs.get('translated_seconds')) if kwargs.get('translated_seconds') else None
         self.total_seconds: Optional[int] = int(kwargs.get('total_seconds')) if kwargs.get('total_seconds') else None
         self.error_reason: Optional[str] = kwargs.get('error_reason')
 
 
+def _documents_cache_dir() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'lara-sdk', 'documents')
+
+
+def _read_cached_file(path: str, dest: Optional[DownloadDestination]) -> Optional[bytes]:
+    if dest is None:
+        with open(path, 'rb') as stream:
+            return stream.read()
+
+    if isinstance(dest, (str, os.PathLike)):
+        shutil.copyfile(path, dest)
+    else:
+        with open(path, 'rb') as stream:
+            shutil.copyfileobj(stream, dest)
+    return None
+
+
 class Documents:
-    def __init__(self, client: LaraClient):
+    def __init__(self, client: LaraClient, s3client: Optional[S3Client] = None):
         self._client: LaraClient = client
-        self._s3client = S3Client()
-        self._polling_interval: int = 2
+        self._s3client: S3Client = s3client if s3client is not None else S3Client()
+        self._min_polling_interval: float = .5
+        self._max_polling_interval: float = 8.
 
     def upload(self, file_path: str, filename: str, target: str, source: Optional[str] = None,
                adapt_to: Optional[List[str]] = None, glossaries: Optional[List[str]] = None, no_trace: bool = False,
@@ -513,27 +882,12 @@ class Documents:
 
             self._s3client.upload(url, fields, file_payload)
 
-        body = {
-            's3key': fields['key'],
-            'target': target,
-        }
-        if source is not None:
-            body['source'] = source
-
-        if adapt_to is not None:
-            body['adapt_to'] = adapt_to
-
-        if glossaries is not None:
-            body['glossaries'] = glossaries
-
-        if password is not None:
-            body['password'] = password
-
-        if style is not None:
-            body['style'] = style
-
-        if extraction_params is not None:
-            body['extraction_params'] = extraction_params.to_dict()
+        body = {'s3key': fields['key'], 'target': target}
+        for key, value in (('source', source), ('adapt_to', adapt_to), ('glossaries', glossaries),
+                           ('password', password), ('style', style),
+                           ('extraction_params', extraction_params.to_dict() if extraction_params is not None else None)):
+            if value is not None:
+                body[key] = value
 
         headers = None
         if no_trace is True:
@@ -544,40 +898,149 @@ class Documents:
     def status(self, id: str) -> Document:
         return Document(**self._client.get(f'/v2/documents/{id}'))
 
-    def download(self, id: str, output_format: Optional[str] = None) -> bytes:
+    def download(self, id: str, output_format: Optional[str] = None, *,
+                 dest: Optional[DownloadDestination] = None) -> Optional[bytes]:
         params = {}
         if output_format is not None:
             params['output_format'] = output_format
         url: str = self._client.get(f'/v2/documents/{id}/download-url', params)['url']
-        return self._s3client.download(url=url)
+        return self._s3client.download(url=url, dest=dest)
 
     def translate(self, file_path: str, filename: str, target: str, source: Optional[str] = None,
                   adapt_to: Optional[List[str]] = None, glossaries: Optional[List[str]] = None, output_format: Optional[str] = None,
                   no_trace: bool = False, style: Optional[TranslationStyle] = None, password: Optional[str] = None,
-                  extraction_params: Optional[DocumentExtractionParams] = None) -> bytes:
+                  extraction_params: Optional[DocumentExtractionParams] = None, *,
+                  dest: Optional[DownloadDestination] = None, cache: bool = False) -> Optional[bytes]:
+        """
+        Uploads a document, waits for its translation and downloads it (into dest, if given).
+        """
+        return self._translate_all([(file_path, filename, dest)], target=target, source=source, adapt_to=adapt_to,
+                                   glossaries=glossaries, output_format=output_format, no_trace=no_trace, style=style,
+                                   password=password, extraction_params=extraction_params, cache=cache,
+                                   max_workers=1)[0]
+
+    def _translate_all(self, jobs: List[Tuple[str, str, Optional[DownloadDestination]]], *, target: str,
+                       source: Optional[str], adapt_to: Optional[List[str]], glossaries: Optional[List[str]],
+                       output_format: Optional[str], no_trace: bool, style: Optional[TranslationStyle],
+                       password: Optional[str], extraction_params: Optional[DocumentExtractionParams], cache: bool,
+                       max_workers: int) -> List[Optional[bytes]]:
+        """
+        Translates the (file_path, filename, dest) jobs with the same options, with one polling loop.
+        """
+        results: List[Optional[bytes]] = [None] * len(jobs)
+        cache_paths: List[Optional[str]] = [None] * len(jobs)
+        pending: List[int] = []
+
+        for i, (file_path, filename, dest) in enumerate(jobs):
+            if cache and not no_trace:
+                cache_paths[i] = self._result_cache_path(
+                    file_path, filename=filename, target=target, source=source, adapt_to=adapt_to,
+                    glossaries=glossaries, output_format=output_format, style=style,
+                    extraction_params=extraction_params.to_dict() if extraction_params is not None else None)
+                if os.path.exists(cache_paths[i]):
+                    results[i] = _read_cached_file(cache_paths[i], dest)
+                    continue
+            pending.append(i)
+
+        def upload(i: int) -> Tuple[Document, float]:
+            document = self.upload(file_path=jobs[i][0], filename=jobs[i][1], target=target, source=source,
+                                   adapt_to=adapt_to, glossaries=glossaries, no_trace=no_trace, style=style,
+                                   password=password, extraction_params=extraction_params)
+            return document, time.monotonic()
+
+        uploaded = _map_concurrently(upload, pending, max_workers)
+        documents: Dict[int, Document] = {i: document for i, (document, _) in zip(pending, uploaded)}
+        started: Dict[int, float] = {i: start for i, (_, start) in zip(pending, uploaded)}
+
+        max_wait_time = 60 * 15 # 15 minutes, per document
+        intervals = _polling_intervals(self._min_polling_interval, self._max_polling_interval)
+
+        while documents:
+            now = time.monotonic()
+            if any(now - started[i] >= max_wait_time for i in documents):
+                raise TimeoutError()
 
-        document = self.upload(file_path=file_path, filename=filename, target=target, source=source, adapt_to=adapt_to,
-                               glossaries=glossaries, no_trace=no_trace, style=style, password=password, extraction_params=extraction_params)
+            indexes = list(documents)
+            updated = dict(zip(indexes, _map_concurrently(lambda i: self.status(id=documents[i].id), indexes,
+                                                          max_workers)))
 
-        max_wait_time = 60 * 15 # 15 minutes
-        start = time.time()
+            for document in updated.values():
+                if document.status is DocumentStatus.ERROR:
+                    raise LaraApiError(500, "DocumentError", document.error_reason)
 
-        while time.time() - start < max_wait_time:
-            document = self.status(id=document.id)
+            translated = [i for i in indexes if updated[i].status is DocumentStatus.TRANSLATED]
+            contents = _map_concurrently(lambda i: self._download_result(updated[i].id, output_format, jobs[i][2],
+                                                                         cache_paths[i]), translated, max_workers)
+            for i, content in zip(translated, contents):
+                results[i] = content
+                del updated[i]
 
-            if document.status == DocumentStatus.TRANSLATED:
-                return self.download(id=document.id, output_format=output_format)
-            elif document.status == DocumentStatus.ERROR:
-                raise LaraApiError(500, "DocumentError", document.error_reason)
+            if any(updated[i].status is not documents[i].status for i in updated):
+                # A new processing stage has started: check it again soon, then back off
+                intervals = _polling_intervals(self._min_polling_interval, self._max_polling_interval)
 
-            time.sleep(self._polling_interval)
-        raise TimeoutError()
+            documents = updated
+            if documents:
+                time.sleep(next(intervals))
+
+        return results
+
+    def _download_result(self, id: str, output_format: Optional[str], dest: Optional[DownloadDestination],
+                         cache_path: Optional[str]) -> Optional[bytes]:
+        if cache_path is None:
+            return self.download(id=id, output_format=output_format, dest=dest)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                self.download(id=id, output_format=output_format, dest=tmp_file)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return _read_cached_file(cache_path, dest)
+
+    def _result_cache_path(self, file_path: str, **options) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as stream:
+            for chunk in iter(lambda: stream.read(64 * 1024), b''):
+                digest.update(chunk)
+        digest.update(json.dumps([self._client.base_url, options], sort_keys=True).encode('UTF-8'))
+
+        cache_dir = _documents_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, digest.hexdigest())
+
+    def translate_many(self, file_paths: List[str], target: str, source: Optional[str] = None,
+                       adapt_to: Optional[List[str]] = None, glossaries: Optional[List[str]] = None,
+                       output_format: Optional[str] = None, no_trace: bool = False,
+                       style: Optional[TranslationStyle] = None, password: Optional[str] = None,
+                       extraction_params: Optional[DocumentExtractionParams] = None, *,
+                       dest_dir: Optional[str] = None, max_workers: int = 4,
+                       cache: bool = False) -> List[Optional[bytes]]:
+        """
+        Translates multiple documents with the same options, returning the results in order.
+        """
+        jobs = []
+        filenames = set()
+        for file_path in file_paths:
+            filename = os.path.basename(file_path)
+            if dest_dir is not None:
+                if filename in filenames:
+                    raise ValueError(f'Multiple documents named {filename} cannot be saved to the same dest_dir')
+                filenames.add(filename)
+            jobs.append((file_path, filename, os.path.join(dest_dir, filename) if dest_dir is not None else None))
+
+        return self._translate_all(jobs, target=target, source=source, adapt_to=adapt_to, glossaries=glossaries,
+                                   output_format=output_format, no_trace=no_trace, style=style, password=password,
+                                   extraction_params=extraction_params, cache=cache, max_workers=max_workers)
 
 class AudioTranslator:
-    def __init__(self, client: LaraClient):
+    def __init__(self, client: LaraClient, s3client: Optional[S3Client] = None):
         self._client: LaraClient = client
-        self._s3client = S3Client()
-        self._polling_interval: int = 2
+        self._s3client: S3Client = s3client if s3client is not None else S3Client()
+        self._min_polling_interval: float = .5
+        self._max_polling_interval: float = 8.
 
     def upload(self, file_path: str, filename: str, target: str, source: Optional[str] = None,
                adapt_to: Optional[List[str]] = None, glossaries: Optional[List[str]] = None,
@@ -591,23 +1054,11 @@ class AudioTranslator:
 
             self._s3client.upload(url, fields, file_payload)
 
-        body = {
-            's3key': fields['key'],
-            'target': target,
-        }
-        if source is not None:
-            body['source'] = source
-
-        if adapt_to is not None:
-            body['adapt_to'] = adapt_to
-
-        if glossaries is not None:
-            body['glossaries'] = glossaries
-
-        if style is not None:
-            body['style'] = style
-        if voice_gender is not None:
-            body['voice_gender'] = voice_gender.value
+        body = {'s3key': fields['key'], 'target': target}
+        for key, value in (('source', source), ('adapt_to', adapt_to), ('glossaries', glossaries), ('style', style),
+                           ('voice_gender', voice_gender.value if voice_gender is not None else None)):
+            if value is not None:
+                body[key] = value
 
         headers = None
         if no_trace is True:
@@ -618,34 +1069,44 @@ class AudioTranslator:
     def status(self, id: str) -> Audio:
         return Audio(**self._client.get(f'/v2/audio/{id}'))
 
-    def download(self, id: str) -> bytes:
+    def download(self, id: str, *, dest: Optional[DownloadDestination] = None) -> Optional[bytes]:
         url: str = self._client.get(f'/v2/audio/{id}/download-url')['url']
-        return self._s3client.download(url=url)
+        return self._s3client.download(url=url, dest=dest)
 
     def translate(self, file_path: str, filename: str, target: str, source: Optional[str] = None,
                   adapt_to: Optional[List[str]] = None, glossaries: Optional[List[str]] = None,
                   no_trace: bool = False, style: Optional[TranslationStyle] = None,
-                  voice_gender: Optional[VoiceGender] = None) -> bytes:
+                  voice_gender: Optional[VoiceGender] = None, *,
+                  dest: Optional[DownloadDestination] = None) -> Optional[bytes]:
 
         audio = self.upload(file_path=file_path, filename=filename, target=target, source=source,
                             adapt_to=adapt_to, glossaries=glossaries, no_trace=no_trace, style=style,
                             voice_gender=voice_gender)
 
         max_wait_time = 60 * 15 # 15 minutes
-        start = time.time()
+        start = time.monotonic()
+        intervals = _polling_intervals(self._min_polling_interval, self._max_polling_interval)
+        status = audio.status
 
-        while time.time() - start < max_wait_time:
+        while time.monotonic() - start < max_wait_time:
             audio = self.status(id=audio.id)
 
-            if audio.status == AudioStatus.TRANSLATED:
-                return self.download(id=audio.id)
-            elif audio.status == AudioStatus.ERROR:
+            if audio.status is AudioStatus.TRANSLATED:
+                return self.download(id=audio.id, dest=dest)
+            elif audio.status is AudioStatus.ERROR:
                 raise LaraApiError(500, "AudioError", audio.error_reason)
 
-            time.sleep(self._polling_interval)
+            if audio.status is not status:
+                # A new processing stage has started: check it again soon, then back off
+                status = audio.status
+                intervals = _polling_intervals(self._min_polling_interval, self._max_polling_interval)
+
+            time.sleep(next(intervals))
         raise TimeoutError()
 
 class ImageParagraph(LaraObject):
+    __slots__ = ('text', 'translation', 'adapted_to_matches', 'glossaries_matches')
+
     def __init__(self, **kwargs):
         self.text: str = kwargs.get('text')
         self.translation: str = kwargs.get('translation')
@@ -653,6 +1114,8 @@ class ImageParagraph(LaraObject):
         self.glossaries_matches: Optional[List[NGGlossaryMatch]] = [NGGlossaryMatch(**m) for m in kwargs.get('glossaries_matches', [])] if kwargs.get('glossaries_matches') is not None else None
 
 class ImageTextResult(LaraObject):
+    __slots__ = ('source_language', 'adapted_to', 'glossaries', 'paragraphs')
+
     def __init__(self, **kwargs):
         self.source_language: str = kwargs.get('source_language')
         self.adapted_to: Optional[List[str]] = kwargs.get('adapted_to', None)
@@ -738,9 +1201,167 @@ class UseCache(Enum):
     OVERWRITE = 'overwrite'
 
 
+_TRANSLATE_PRIORITIES: Dict[str, TranslatePriority] = {priority.value: priority for priority in TranslatePriority}
+_USE_CACHE_VALUES: Dict[str, UseCache] = {use_cache.value: use_cache for use_cache in UseCache}
+
+
+@dataclass
+class TranslateRequest:
+    text: Union[str, List[str], List[TextBlock]]
+    target: str
+    source: Optional[str] = None
+    source_hint: Optional[str] = None
+    adapt_to: Optional[List[str]] = None
+    glossaries: Optional[List[str]] = None
+    instructions: Optional[List[str]] = None
+    content_type: Optional[str] = None
+    style: Optional[TranslationStyle] = None
+    # Any other keyword argument accepted by Translator.translate()
+    options: Dict[str, object] = field(default_factory=dict)
+
+
+def _merge_translate_results(results: List[Dict]) -> Dict:
+    """
+    Merges the raw results of a translation split in chunks.
+    """
+    def concat(values):
+        if all(isinstance(v, list) for v in values):
+            return [e for v in values for e in v]
+        return values[0]
+
+    merged = dict(results[0])
+    for key in ('translation', 'adapted_to_matches', 'glossaries_matches'):
+        if key in merged:
+            merged[key] = concat([r.get(key) for r in results])
+
+    for key, sub_keys in (('profanities', ('target', 'source')),
+                          ('styleguide_results', ('original_translation', 'changes'))):
+        if isinstance(merged.get(key), dict):
+            merged[key] = dict(merged[key])
+            for sub_key in sub_keys:
+                merged[key][sub_key] = concat([(r.get(key) or {}).get(sub_key) for r in results])
+
+    return merged
+
+
+class _TTLCache:
+    """
+    A thread-safe LRU cache whose entries also expire after their own time-to-live.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize: int = maxsize
+        self._entries: 'OrderedDict[object, Tuple[float, object]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, value, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _TranslateBatch:
+    """
+    Coalesces single-text translations with the same options into batched requests.
+    """
+
+    def __init__(self, translator: 'Translator', max_size: int, options: Dict):
+        self._translator: 'Translator' = translator
+        self._max_size: int = max_size
+        self._options: Dict = options
+        self._texts: List[str] = []
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+
+    def translate(self, text: str) -> 'Future[str]':
+        """
+        Queues a text, returning a future resolved once its batch is sent.
+        """
+        future = Future()
+        with self._lock:
+            self._texts.append(text)
+            self._futures.append(future)
+            full = len(self._texts) >= self._max_size
+
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> None:
+        """
+        Sends the texts queued so far.
+        """
+        with self._lock:
+            texts, futures = self._texts, self._futures
+            self._texts, self._futures = [], []
+        if not texts:
+            return
+
+        try:
+            result = self._translator.translate(texts, **self._options)
+            if len(result.translation) != len(futures):
+                raise LaraApiError(500, "TranslationError",
+                                   f'Expected {len(futures)} translations, got {len(result.translation)}')
+
+            for future, translation in zip(futures, result.translation):
+                future.set_result(translation)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+    def __enter__(self) -> '_TranslateBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+
+        # The block failed: the texts not sent yet are dropped
+        with self._lock:
+            futures, self._texts, self._futures = self._futures, [], []
+        for future in futures:
+            future.cancel()
+
+
+# Supported languages by server URL, shared by all the Translator instances: (fetch time, languages)
+_languages_cache: Dict[str, Tuple[float, List[str]]] = {}
+_languages_lock = threading.Lock()
+
+
 class Translator:
+    _languages_ttl: float = 24 * 60 * 60
+    _translate_cache_size: int = 1024
+    _translate_cache_ttl: float = 5 * 60
+
     def __init__(self, credentials: Union[AccessKey, AuthToken, Credentials] = None, *,
-                 access_key_id: str = None, access_key_secret: str = None, server_url: str = None):
+                 access_key_id: str = None, access_key_secret: str = None, server_url: str = None,
+                 lookup_cache_ttl: float = 0):
         """
         Initialize the Translator with authentication.
 
@@ -748,6 +1369,8 @@ class Translator:
         :param access_key_id: (Deprecated) Use AccessKey(id, secret) instead
         :param access_key_secret: (Deprecated) Use AccessKey(id, secret) instead
         :param server_url: Optional custom server URL
+        :param lookup_cache_ttl: Optional number of seconds memories.get(), glossaries.get() and glossaries.counts()
+            results are cached for (disabled by default)
         """
         if credentials is None:
             if access_key_id is not None and access_key_secret is not None:
@@ -764,21 +1387,87 @@ class Translator:
                 raise ValueError('auth parameter is required (AccessKey, AuthToken, or Credentials)')
 
         self._client: LaraClient = LaraClient(credentials, server_url)
-        self.memories: Memories = Memories(self._client)
-        self.documents: Documents = Documents(self._client)
-        self.glossaries: Glossaries = Glossaries(self._client)
-        self.styleguides: Styleguides = Styleguides(self._client)
-        self.audio: AudioTranslator = AudioTranslator(self._client)
-        self.images: ImageTranslator = ImageTranslator(self._client)
+        self._lookup_cache_ttl: float = lookup_cache_ttl
+        self._translate_cache: _TTLCache = _TTLCache(self._translate_cache_size)
+
+    # Sub-clients are only created the first time they are used
+
+    @cached_property
+    def _s3client(self) -> S3Client:
+        # Documents and audio files share the same S3 connection pool
+        return S3Client()
+
+    @cached_property
+    def memories(self) -> Memories:
+        return Memories(self._client, self._lookup_cache_ttl)
+
+    @cached_property
+    def documents(self) -> Documents:
+        return Documents(self._client, self._s3client)
+
+    @cached_property
+    def glossaries(self) -> Glossaries:
+        return Glossaries(self._client, self._lookup_cache_ttl)
+
+    @cached_property
+    def styleguides(self) -> Styleguides:
+        return Styleguides(self._client)
+
+    @cached_property
+    def audio(self) -> AudioTranslator:
+        return AudioTranslator(self._client, self._s3client)
+
+    @cached_property
+    def images(self) -> ImageTranslator:
+        return ImageTranslator(self._client)
+
+    def close(self) -> None:
+        """
+        Releases the pooled HTTP connections held by this translator.
+        """
+        self._client.close()
+        s3client = self.__dict__.get('_s3client')
+        if s3client is not None:
+            s3client.close()
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops the locally cached translations and memory/glossary lookups of this translator.
+        """
+        self._translate_cache.clear()
+        for sub_client in (self.__dict__.get('memories'), self.__dict__.get('glossaries')):
+            if sub_client is not None:
+                sub_client._get_cache.clear()
 
-    def languages(self) -> List[str]:
-        return self._client.get('/v2/languages')
+    def __enter__(self) -> 'Translator':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def languages(self, *, force_refresh: bool = False) -> List[str]:
+        """
+        Returns the list of supported languages, cached per server for a day.
+        """
+        cached = _languages_cache.get(self._client.base_url)
+        if not force_refresh and cached is not None and time.monotonic() - cached[0] < self._languages_ttl:
+            return list(cached[1])
+
+        # Threads finding the cache empty or expired at the same time wait for a single fetch
+        with _languages_lock:
+            cached = _languages_cache.get(self._client.base_url)
+            if force_refresh or cached is None or time.monotonic() - cached[0] >= self._languages_ttl:
+                cached = (time.monotonic(), self._client.get('/v2/languages'))
+                _languages_cache[self._client.base_url] = cached
+
+        return list(cached[1])
 
     def translate(self, text: Union[str, Iterable[str], Iterable[TextBlock]], *,
                   source: str = None, source_hint: str = None, target: str, adapt_to: List[str] = None,
                   glossaries: List[str] = None, instructions: List[str] = None, content_type: str = None,
-                  multiline: bool = True, timeout_ms: int = None, priority: TranslatePriority = None,
-                  use_cache: Union[bool, UseCache] = None, cache_ttl_s: int = None,
+                  multiline: bool = True, timeout_ms: int = None,
+                  priority: Union[TranslatePriority, str] = None,
+                  use_cache: Union[bool, UseCache, str] = None, cache_ttl_s: int = None,
                   no_trace: bool = False, verbose: bool = False, style: Optional[TranslationStyle] = None,
                   headers: Optional[Dict[str, str]] = None, reasoning: bool = False,
                   metadata: Optional[Union[str, Dict]] = None,
@@ -787,36 +1476,57 @@ class Translator:
                   styleguide_id: Optional[str] = None,
                   styleguide_reasoning: Optional[bool] = None,
                   styleguide_explanation_language: Optional[str] = None,
-                  callback: Optional[Callable[[TextResult], None]] = None) -> TextResult:
+                  callback: Optional[Callable[[TextResult], None]] = None,
+                  chunk_size: Optional[int] = None, parallel_limit: int = 4) -> TextResult:
+        """
+        Translates a string, or a list of strings/TextBlocks.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        if parallel_limit < 1:
+            raise ValueError('parallel_limit must be at least 1')
+
         if isinstance(text, str):
             q = text
-        elif hasattr(text, '__iter__'):
-            if all(isinstance(e, str) for e in text):
+        else:
+            # Lists and tuples are used as they are, any other iterable is materialized once
+            if isinstance(text, (list, tuple)):
+                q = text
+            elif hasattr(text, '__iter__'):
                 q = list(text)
-            elif all(isinstance(e, TextBlock) for e in text):
-                q = [e.__dict__ for e in text]
             else:
+                raise ValueError('text must be a string or an iterable')
+
+            # The type of the first element tells which kind of list this is: only that type is then checked
+            if q and isinstance(q[0], TextBlock):
+                if not all(isinstance(e, TextBlock) for e in q):
+                    raise ValueError('text must be an iterable of strings or TextBlock objects')
+                q = [{'text': e.text, 'translatable': e.translatable} for e in q]
+            elif not all(isinstance(e, str) for e in q):
                 raise ValueError('text must be an iterable of strings or TextBlock objects')
-        else:
-            raise ValueError('text must be a string or an iterable')
 
+        # Raw option values ('background', 'yes', ...) are accepted as well as enum members
+        if isinstance(priority, str):
+            priority = _TRANSLATE_PRIORITIES.get(priority) or TranslatePriority(priority)
         if use_cache is True:
             use_cache = UseCache.YES
         elif use_cache is False:
             use_cache = UseCache.NO
-
-        body = {
-            'source': source, 'target': target, 'source_hint': source_hint, 'content_type': content_type,
-            'multiline': multiline, 'adapt_to': adapt_to, 'instructions': instructions, 'timeout': timeout_ms, 'q': q,
-            'priority': priority.value if priority is not None else None,
-            'use_cache': use_cache.value if use_cache is not None else None, 'cache_ttl': cache_ttl_s,
-            'glossaries': glossaries, 'verbose': verbose, 'style': style, 'reasoning': reasoning,
-            'metadata': metadata,
-            'profanities_detect': profanities_detect,
-            'profanities_handling': profanities_handling,
-            'styleguide_id': styleguide_id, 'styleguide_reasoning': styleguide_reasoning,
-            'styleguide_explanation_language': styleguide_explanation_language
-        }
+        elif isinstance(use_cache, str):
+            use_cache = _USE_CACHE_VALUES.get(use_cache) or UseCache(use_cache)
+
+        body = {'target': target, 'q': q, 'multiline': multiline, 'verbose': verbose, 'reasoning': reasoning}
+        for key, value in (('source', source), ('source_hint', source_hint), ('content_type', content_type),
+                           ('adapt_to', adapt_to), ('instructions', instructions), ('timeout', timeout_ms),
+                           ('priority', priority.value if priority is not None else None),
+                           ('use_cache', use_cache.value if use_cache is not None else None),
+                           ('cache_ttl', cache_ttl_s), ('glossaries', glossaries), ('style', style),
+                           ('metadata', metadata), ('profanities_detect', profanities_detect),
+                           ('profanities_handling', profanities_handling), ('styleguide_id', styleguide_id),
+                           ('styleguide_reasoning', styleguide_reasoning),
+                           ('styleguide_explanation_language', styleguide_explanation_language)):
+            if value is not None:
+                body[key] = value
 
         request_headers = {}
         if headers is not None:
@@ -824,16 +1534,45 @@ class Translator:
         if no_trace is True:
             request_headers['X-No-Trace'] = 'true'
 
+        # With use_cache=YES the result of an identical request is also reused locally, without calling the API
+        cache_key = None
+        if use_cache is UseCache.YES and callback is None and no_trace is not True:
+            digest = hashlib.blake2b(_json_dumps(body), digest_size=16)
+            digest.update(_json_dumps(sorted(request_headers.items())))
+            cache_key = digest.digest()
+            cached = self._translate_cache.get(cache_key)
+            if cached is not None:
+                return TextResult(**copy.deepcopy(cached))
+
+        if chunk_size is not None and not isinstance(q, str) and len(q) > chunk_size:
+            if callback is not None:
+                raise ValueError('callback is not supported when the text is split in chunks')
+
+            chunks = [q[i:i + chunk_size] for i in range(0, len(q), chunk_size)]
+            results = _map_concurrently(lambda chunk: self._translate({**body, 'q': chunk}, request_headers),
+                                        chunks, parallel_limit)
+            result = _merge_translate_results(results)
+        else:
+            result = self._translate(body, request_headers, callback if reasoning else None)
+
+        if cache_key is not None:
+            ttl = cache_ttl_s if cache_ttl_s is not None else self._translate_cache_ttl
+            self._translate_cache.put(cache_key, copy.deepcopy(result), ttl)
+
+        return TextResult(**result)
+
+    def _translate(self, body: Dict, headers: Dict[str, str],
+                   callback: Optional[Callable[[TextResult], None]] = None) -> Dict:
         last_result = None
-        for partial in self._client.post_and_get_stream('/v2/translate', body, headers=request_headers):
+        for partial in self._client.post_and_get_stream('/v2/translate', body, headers=headers):
             last_result = partial
-            if callback is not None and reasoning:
+            if callback is not None:
                 callback(TextResult(**partial))
 
         if last_result is None:
             raise ValueError('No translation result received.')
 
-        return TextResult(**last_result)
+        return last_result
 
     def detect(self, text: Union[str, List[str]], *, hint: Optional[str] = None,
                passlist: Optional[List[str]] = None) -> DetectResult:
@@ -845,6 +1584,29 @@ class Translator:
 
         return DetectResult(**self._client.post('/v2/detect/language', body))
 
+    def translate_many(self, requests: List[TranslateRequest], *, max_workers: int = 8) -> List[TextResult]:
+        """
+        Translates multiple independent requests, each one with its own target and options.
+        """
+        return _map_concurrently(
+            lambda r: self.translate(r.text, target=r.target, source=r.source, source_hint=r.source_hint,
+                                     adapt_to=r.adapt_to, glossaries=r.glossaries, instructions=r.instructions,
+                                     content_type=r.content_type, style=r.style, **r.options),
+            list(requests), max_workers)
+
+    def batch(self, *, target: str, source: str = None, max_size: int = 128, **options) -> _TranslateBatch:
+        """
+        Returns a context manager that coalesces single-text translations with the same options.
+        """
+        return _TranslateBatch(self, max_size, {'target': target, 'source': source, **options})
+
+    def detect_batch(self, requests: List[DetectRequest], *, max_workers: int = 8) -> List[DetectResult]:
+        """
+        Detects the language of multiple independent inputs, each one with its own hint and passlist.
+        """
+        return _map_concurrently(lambda r: self.detect(r.text, hint=r.hint, passlist=r.passlist),
+                                 list(requests), max_workers)
+
     def detect_profanities(self, text: str, *, language: str, content_type: str) -> ProfanityDetectResult:
         body = {
             'text': text,
@@ -0,0 +1,57 @@
+import base64
+import json
+import time
+from typing import Callable, Dict, List, Tuple
+
+from lara_sdk import AuthToken
+
+
+def auth_token() -> AuthToken:
+    # A not yet expired JWT, so that no authentication request is sent
+    payload = base64.urlsafe_b64encode(json.dumps({'exp': time.time() + 3600}).encode()).decode().rstrip('=')
+    return AuthToken(f'header.{payload}.signature', 'refresh-token')
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, data=None, content: bytes = None, content_type: str = None):
+        self.status_code: int = status_code
+        self.content: bytes = json.dumps(data).encode() if content is None else content
+        self.text: str = self.content.decode('UTF-8', errors='replace')
+        self.headers: Dict[str, str] = {
+            'Content-Type': content_type or ('application/json' if content is None else 'text/html')}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_lines(self):
+        yield from self.content.splitlines()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeSession:
+    """
+    Replaces requests.Session.request: each request is answered by the first route whose method and path
+    fragment match, and recorded in calls.
+    """
+
+    def __init__(self):
+        self.routes: List[Tuple[str, str, Callable[..., FakeResponse]]] = []
+        self.calls: List[Tuple[str, str, dict]] = []
+
+    def route(self, method: str, path: str, handler: Callable[..., FakeResponse]) -> None:
+        self.routes.append((method, path, handler))
+
+    def request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        self.calls.append((method, url, kwargs))
+        for route_method, path, handler in self.routes:
+            if route_method == method and path in url:
+                return handler(url, **kwargs)
+        raise AssertionError(f'Unexpected request: {method} {url}')
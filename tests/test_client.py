@@ -0,0 +1,47 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from lara_sdk import LaraApiError, Translator
+
+from fakes import auth_token
+
+
+class _BadGatewayHandler(BaseHTTPRequestHandler):
+    requests_count = 0
+
+    def do_GET(self):
+        type(self).requests_count += 1
+        body = b'<html><body><h1>502 Bad Gateway</h1></body></html>'
+        self.send_response(502)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class GatewayRetryTest(unittest.TestCase):
+    def setUp(self):
+        _BadGatewayHandler.requests_count = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _BadGatewayHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        self.translator = Translator(auth_token(), server_url=f'http://127.0.0.1:{server.server_port}')
+        self.addCleanup(self.translator.close)
+
+    def test_exhausted_retries_raise_lara_api_error(self):
+        with self.assertRaises(LaraApiError) as context:
+            self.translator.memories.list()
+
+        self.assertEqual(context.exception.status_code, 502)
+        self.assertIn('502 Bad Gateway', context.exception.message)
+        self.assertEqual(_BadGatewayHandler.requests_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
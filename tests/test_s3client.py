@@ -0,0 +1,54 @@
+import io
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from lara_sdk._s3client import S3Client
+
+
+class _RedirectingHandler(BaseHTTPRequestHandler):
+    bodies = []
+    timeout = 5
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        if self.path == '/upload':
+            self.send_response(307)
+            self.send_header('Location', '/redirected')
+        else:
+            type(self).bodies.append(body)
+            self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class UploadTest(unittest.TestCase):
+    def setUp(self):
+        _RedirectingHandler.bodies = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _RedirectingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        self.url = f'http://127.0.0.1:{server.server_port}'
+        self.client = S3Client()
+        self.addCleanup(self.client.close)
+
+    def test_body_is_resent_on_redirect(self):
+        content = b'document content ' * 1000
+        fields = {'acl': 'private', 'bucket': 'bucket', 'key': 'key'}
+
+        self.client.upload(f'{self.url}/upload', fields, io.BytesIO(content))
+
+        self.assertEqual(len(_RedirectingHandler.bodies), 1)
+        body = _RedirectingHandler.bodies[0]
+        self.assertIn(b'name="key"\r\n\r\nkey\r\n', body)
+        self.assertIn(content, body)
+        self.assertTrue(body.endswith(b'--\r\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import unittest
+from unittest import mock
+
+import requests
+
+from lara_sdk import MemoryImport, Translator, UseCache
+
+from fakes import FakeResponse, FakeSession, auth_token
+
+
+class TranslateCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        patcher = mock.patch.object(requests.Session, 'request', self.session.request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.session.route('POST', '/v2/translate', lambda url, **kwargs: FakeResponse(data={
+            'content_type': 'text/plain', 'source_language': 'en', 'translation': json.loads(kwargs['data'])['q']}))
+        self.translator = Translator(auth_token())
+
+    def test_non_str_metadata_keys(self):
+        metadata = {1: 'a', 'b': 2}
+        first = self.translator.translate('hello', target='it', metadata=metadata, use_cache=UseCache.YES)
+        second = self.translator.translate('hello', target='it', metadata=metadata, use_cache=UseCache.YES)
+
+        self.assertEqual(first.translation, 'hello')
+        self.assertEqual(second.translation, 'hello')
+        self.assertEqual(len(self.session.calls), 1)
+
+
+class ImportPollingTest(unittest.TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        patcher = mock.patch.object(requests.Session, 'request', self.session.request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.translator = Translator(auth_token())
+        self.translator.memories._min_polling_interval = self.translator.memories._max_polling_interval = .001
+
+    def test_non_json_gateway_error_is_transient(self):
+        responses = iter([
+            FakeResponse(data={'id': 'import-1', 'progress': .5}),
+            FakeResponse(503, content=b'<html><body>503 Service Unavailable</body></html>'),
+            FakeResponse(503, content=b''),
+            FakeResponse(data={'id': 'import-1', 'progress': 1.}),
+        ])
+        self.session.route('GET', '/v2/memories/imports/import-1', lambda url, **kwargs: next(responses))
+
+        result = self.translator.memories.wait_for_import(MemoryImport(id='import-1', progress=0))
+
+        self.assertEqual(result.progress, 1.)
+        self.assertEqual(len(self.session.calls), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()